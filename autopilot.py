@@ -2,12 +2,15 @@
 """
 🚀 AI SHORTS AUTOPILOT - COMPLETE AUTOMATION WITH MULTI-LLM ANALYSIS
 Finds viral AI videos → Analyzes with Gemini/Claude/GPT → Generates shorts → Posts at optimal times
-Usage: python3 autopilot.py
+Usage: python3 autopilot.py [--continuous]
 """
 
 import os
+import sys
 import json
 import time
+import signal
+import threading
 import random
 import logging
 from datetime import datetime, timezone, timedelta
@@ -513,8 +516,10 @@ class AnalyticsTracker:
     
     def save_stats(self):
         """Save stats"""
-        with open(self.stats_file, 'w') as f:
+        tmp_file = f"{self.stats_file}.tmp"
+        with open(tmp_file, 'w', buffering=1 << 20) as f:
             json.dump(self.stats, f, indent=2)
+        os.replace(tmp_file, self.stats_file)  # atomic - a crash can't truncate the stats
     
     def log_post(self, title: str, affiliate: str):
         """Log post"""
@@ -599,6 +604,23 @@ class AutopilotOrchestrator:
             logger.error(f"❌ Pipeline error: {e}")
 
 # ==================== MAIN ====================
+def run_continuous(orchestrator: AutopilotOrchestrator, stop_event: threading.Event, every_hours: int = 6):
+    """Run the pipeline every few hours until stop_event is set
+    
+    Sleeps until the next job is due (schedule.idle_seconds) instead of polling,
+    capped at an hour so clock changes are picked up; setting stop_event wakes it.
+    """
+    schedule.every(every_hours).hours.do(orchestrator.run_full_pipeline)
+    
+    while not stop_event.is_set():
+        idle = schedule.idle_seconds()
+        if idle is None:
+            break
+        if idle > 0:
+            stop_event.wait(min(idle, 3600))
+            continue
+        schedule.run_pending()
+
 def main():
     """Entry point"""
     try:
@@ -607,11 +629,12 @@ def main():
         # Single run
         orchestrator.run_full_pipeline()
         
-        # Optional: Uncomment for continuous mode
-        # schedule.every(6).hours.do(orchestrator.run_full_pipeline)
-        # while True:
-        #     schedule.run_pending()
-        #     time.sleep(60)
+        # Continuous mode: python3 autopilot.py --continuous
+        if '--continuous' in sys.argv[1:]:
+            stop_event = threading.Event()
+            signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+            signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+            run_continuous(orchestrator, stop_event)
     
     except Exception as e:
         logger.error(f"❌ Fatal error: {e}")
@@ -12,6 +12,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -168,8 +173,16 @@ class CompleteAutomation:
             
             # Save report
             report_file = f"faceless_empire/reports/cycle_{timestamp}.json"
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            tmp_file = f"{report_file}.tmp"
+            # Every value in the report is already a str/number/list/dict
+            # (timestamps are isoformat()'d when built), so no default= hook
+            if orjson is not None:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w', buffering=1 << 20) as f:
+                    json.dump(report, f, indent=2)
+            os.replace(tmp_file, report_file)  # atomic - no partial reports
             
             logger.info(f"✅ Report saved: {report_file}")
             
@@ -228,7 +241,7 @@ How to use {script['tool']} to {script['use_case']}
                 'affiliate_link': script['affiliate_link']
             },
             'video': {
-                'path': video_data['video_path'],
+                'path': str(video_data['video_path']),
                 'youtube_url': youtube_url,
                 'cloudinary_url': video_data.get('cloudinary_url')
             },
@@ -248,27 +261,31 @@ How to use {script['tool']} to {script['use_case']}
     
     def _print_summary(self, report: Dict):
         """Print cycle summary"""
-        logger.info("\n" + "╔" + "="*78 + "╗")
-        logger.info("║" + " "*28 + "CYCLE SUMMARY" + " "*37 + "║")
-        logger.info("╚" + "="*78 + "╝")
-        
-        logger.info(f"\n📝 Script Generated:")
-        logger.info(f"   Hook: {report['script']['hook']}")
-        logger.info(f"   Tool: {report['script']['tool']}")
-        
-        logger.info(f"\n🎬 Video Created:")
-        logger.info(f"   Path: {report['video']['path'][:60]}...")
+        # Built up front and logged as one record, so concurrent log output
+        # can't interleave with the box
+        lines = [
+            "",
+            "╔" + "="*78 + "╗",
+            "║" + " "*28 + "CYCLE SUMMARY" + " "*37 + "║",
+            "╚" + "="*78 + "╝",
+            "",
+            "📝 Script Generated:",
+            f"   Hook: {report['script']['hook']}",
+            f"   Tool: {report['script']['tool']}",
+            "",
+            "🎬 Video Created:",
+            f"   Path: {report['video']['path'][:60]}...",
+        ]
         
         if report['video']['youtube_url']:
-            logger.info(f"\n📤 YouTube Upload:")
-            logger.info(f"   URL: {report['video']['youtube_url']}")
+            lines += ["", "📤 YouTube Upload:", f"   URL: {report['video']['youtube_url']}"]
         
-        logger.info(f"\n🔗 Affiliate Link:")
-        logger.info(f"   {report['script']['affiliate_link']}")
+        lines += ["", "🔗 Affiliate Link:", f"   {report['script']['affiliate_link']}"]
         
-        logger.info(f"\n✅ Next Steps:")
-        for step in report['next_steps']:
-            logger.info(f"   • {step}")
+        lines += ["", "✅ Next Steps:"]
+        lines += [f"   • {step}" for step in report['next_steps']]
+        
+        logger.info("\n".join(lines))
     
     def run_daily_batch(self, count: int = 3, upload_to_youtube: bool = False):
         """Run multiple cycles for daily content"""
@@ -305,25 +322,29 @@ How to use {script['tool']} to {script['use_case']}
         successful = [r for r in results if r.get('status') == 'success']
         failed = [r for r in results if r.get('status') == 'failed']
         
-        logger.info("\n" + "╔" + "="*78 + "╗")
-        logger.info("║" + " "*28 + "BATCH SUMMARY" + " "*37 + "║")
-        logger.info("╚" + "="*78 + "╝")
-        
-        logger.info(f"\n📊 Results:")
-        logger.info(f"   ✅ Successful: {len(successful)}")
-        logger.info(f"   ❌ Failed: {len(failed)}")
+        lines = [
+            "",
+            "╔" + "="*78 + "╗",
+            "║" + " "*28 + "BATCH SUMMARY" + " "*37 + "║",
+            "╚" + "="*78 + "╝",
+            "",
+            "📊 Results:",
+            f"   ✅ Successful: {len(successful)}",
+            f"   ❌ Failed: {len(failed)}",
+        ]
         
         if successful:
-            logger.info(f"\n🎬 Videos Generated:")
+            lines += ["", "🎬 Videos Generated:"]
             for r in successful:
-                logger.info(f"   • {r['script']['hook'][:60]}")
+                lines.append(f"   • {r['script']['hook'][:60]}")
                 if r['video']['youtube_url']:
-                    logger.info(f"     {r['video']['youtube_url']}")
+                    lines.append(f"     {r['video']['youtube_url']}")
         
         if failed:
-            logger.info(f"\n⚠️ Failures:")
-            for r in failed:
-                logger.info(f"   • Error: {r.get('error', 'Unknown')}")
+            lines += ["", "⚠️ Failures:"]
+            lines += [f"   • Error: {r.get('error', 'Unknown')}" for r in failed]
+        
+        logger.info("\n".join(lines))
 
 
 # ==================== CLI ====================
@@ -6,6 +6,8 @@ Everything you need to launch TODAY - Scripts, Hashtags, Analytics, Thumbnails,
 
 import os
 import json
+import sys
+import heapq
 import random
 from pathlib import Path
 from typing import Dict, List
@@ -281,6 +283,8 @@ Follow @YourHandle for daily AI tips"""
 class AnalyticsTracker:
     """Monitor performance and optimize"""
     
+    PLATFORMS = ('youtube', 'tiktok', 'instagram')
+    
     def __init__(self):
         self.db_file = 'analytics.json'
         self.load_data()
@@ -301,8 +305,12 @@ class AnalyticsTracker:
     
     def save_data(self):
         """Save analytics data"""
-        with open(self.db_file, 'w') as f:
+        # Write-then-rename: readers (the /stats endpoint) never see a half-written
+        # file, and a crash mid-write leaves the previous version intact
+        tmp_file = f"{self.db_file}.tmp"
+        with open(tmp_file, 'w', buffering=1 << 20) as f:
             json.dump(self.data, f, indent=2)
+        os.replace(tmp_file, self.db_file)
     
     def track_video(self, video_data: Dict):
         """Track new video"""
@@ -326,20 +334,30 @@ class AnalyticsTracker:
                     'engagement_rate': ((likes + comments) / max(views, 1)) * 100,
                     'updated': datetime.now().isoformat()
                 }
+                # Cross-platform total kept on the record so ranking needn't re-sum it
+                video['total_views'] = sum(video.get(p, {}).get('views', 0) for p in self.PLATFORMS)
                 
                 self.data['total_views'] += views
                 break
         
         self.save_data()
     
+    def _video_views(self, video: Dict) -> int:
+        """Views across platforms; stored by update_stats, summed for older records"""
+        total = video.get('total_views')
+        if total is None:
+            total = sum(video.get(p, {}).get('views', 0) for p in self.PLATFORMS)
+        return total
+    
     def get_best_performers(self, top_n: int = 10) -> List[Dict]:
         """Get top performing videos"""
-        ranked = sorted(
-            self.data['videos'],
-            key=lambda x: sum([x.get(p, {}).get('views', 0) for p in ['youtube', 'tiktok', 'instagram']]),
-            reverse=True
-        )
-        return ranked[:top_n]
+        # Partial selection - same order as a full descending sort, O(n log top_n)
+        best = heapq.nlargest(top_n, self.data['videos'], key=self._video_views)
+        # Every returned record carries its total, so callers don't re-sum platforms
+        for video in best:
+            if 'total_views' not in video:
+                video['total_views'] = self._video_views(video)
+        return best
     
     def get_optimization_insights(self) -> Dict:
         """Get actionable insights"""
@@ -369,23 +387,28 @@ class AnalyticsTracker:
     
     def print_dashboard(self):
         """Print analytics dashboard"""
-        print("\n" + "="*60)
-        print("📊 ANALYTICS DASHBOARD")
-        print("="*60)
-        print(f"Total Videos: {self.data['total_videos']}")
-        print(f"Total Views: {self.data['total_views']:,}")
-        print(f"Avg Views/Video: {self.data['total_views'] / max(self.data['total_videos'], 1):.0f}")
-        
-        print("\n🏆 TOP 5 PERFORMERS:")
+        lines = [
+            "",
+            "="*60,
+            "📊 ANALYTICS DASHBOARD",
+            "="*60,
+            f"Total Videos: {self.data['total_videos']}",
+            f"Total Views: {self.data['total_views']:,}",
+            f"Avg Views/Video: {self.data['total_views'] / max(self.data['total_videos'], 1):.0f}",
+            "",
+            "🏆 TOP 5 PERFORMERS:",
+        ]
         for i, video in enumerate(self.get_best_performers(5), 1):
-            total_views = sum([video.get(p, {}).get('views', 0) for p in ['youtube', 'tiktok', 'instagram']])
-            print(f"{i}. {video['title'][:50]} - {total_views:,} views")
+            lines.append(f"{i}. {video['title'][:50]} - {video['total_views']:,} views")
         
         insights = self.get_optimization_insights()
         if 'recommendation' in insights:
-            print(f"\n💡 INSIGHT: {insights['recommendation']}")
+            lines += ["", f"💡 INSIGHT: {insights['recommendation']}"]
+        
+        lines += ["="*60, "", ""]
         
-        print("="*60 + "\n")
+        # One write instead of a print (lock + write) per line
+        sys.stdout.write("\n".join(lines))
 
 # ==================== 4. THUMBNAIL GENERATOR ====================
 class ThumbnailGenerator:
@@ -5,24 +5,38 @@ Generates actual videos using FFmpeg + AI voices + subtitles + B-roll
 """
 
 import os
+import gc
+import threading
+import functools
 import subprocess
 import json
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import textwrap
 import requests
 from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 from datetime import datetime
 from moviepy.editor import (
-    VideoFileClip, AudioFileClip, TextClip, CompositeVideoClip,
-    concatenate_videoclips, ImageClip, ColorClip
+    VideoFileClip, AudioFileClip, VideoClip,
+    concatenate_videoclips, ImageClip
 )
-from moviepy.video.fx import resize, fadein, fadeout
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 from gtts import gTTS
 import whisper
 from yt_dlp import YoutubeDL
 
+import ffmpeg_encoders
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # Setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,11 +48,13 @@ class VideoGenConfig:
     TEMP_DIR = Path("temp")
     ASSETS_DIR = Path("assets")
     FONTS_DIR = ASSETS_DIR / "fonts"
+    CACHE_DIR = Path("cache")
     
     # Video specs for YouTube Shorts
     WIDTH = 1080
     HEIGHT = 1920
     FPS = 30
+    AUDIO_FPS = 22050  # Voice-only track
     DURATION = 60  # Max 60 seconds
     
     # AI Voice APIs (Choose one or rotate)
@@ -55,8 +71,200 @@ class VideoGenConfig:
     @classmethod
     def init_dirs(cls):
         """Create necessary directories"""
-        for dir_path in [cls.OUTPUT_DIR, cls.TEMP_DIR, cls.ASSETS_DIR, cls.FONTS_DIR]:
-            dir_path.mkdir(parents=True, exist_ok=True)
+        # One listing per parent directory; on warm runs (everything already
+        # there) that replaces a mkdir attempt per path
+        listings = {}
+        for dir_path in [cls.OUTPUT_DIR, cls.TEMP_DIR, cls.ASSETS_DIR, cls.FONTS_DIR, cls.CACHE_DIR]:
+            parent = dir_path.parent
+            if parent not in listings:
+                try:
+                    with os.scandir(parent) as entries:
+                        listings[parent] = {e.name for e in entries if e.is_dir()}
+                except OSError:
+                    listings[parent] = set()
+            
+            if dir_path.name not in listings[parent]:
+                dir_path.mkdir(parents=True, exist_ok=True)
+                listings[parent].add(dir_path.name)
+    
+    @staticmethod
+    def nvenc_available() -> bool:
+        """Hardware H.264 encoder check (one probe per process, shared with the other composers)"""
+        return ffmpeg_encoders.nvenc_available()
+
+# ==================== ASSET CACHE ====================
+class AssetCache:
+    """Content-hash index of downloaded assets (B-roll, voice) kept in CACHE_DIR/assets.json"""
+    
+    # One instance per process (see shared()); the lock guards the index
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self):
+        self.index_path = VideoGenConfig.CACHE_DIR / "assets.json"
+        self.blob_dir = VideoGenConfig.CACHE_DIR / "assets"
+        self._lock = threading.Lock()
+        self.index = self._read_index()
+    
+    @classmethod
+    def shared(cls) -> 'AssetCache':
+        """The process-wide cache, so every fetcher sees (and saves) the same index"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+    
+    def _read_index(self) -> Dict:
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        return {'hashes': index.get('hashes', {}), 'sources': index.get('sources', {})}
+    
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """blake2b of the file contents, truncated to 16 hex chars"""
+        h = hashlib.blake2b()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                h.update(block)
+        return h.hexdigest()[:16]
+    
+    @staticmethod
+    def temp_path(output_path: str) -> str:
+        """Fresh file next to output_path to write a download into before register()"""
+        target = Path(output_path)
+        fd, path = tempfile.mkstemp(dir=target.parent, prefix=f"{target.stem}.", suffix=target.suffix)
+        os.close(fd)
+        return path
+    
+    def lookup(self, source: str, output_path: str) -> Optional[str]:
+        """Link a previously fetched asset into output_path, skipping the download"""
+        with self._lock:
+            h = self.index['sources'].get(source)
+            cached = self.index['hashes'].get(h) if h else None
+        
+        if not cached or not os.path.exists(cached):
+            return None
+        
+        self._link(cached, output_path)
+        logger.info(f"♻️ Asset cache hit ({h}): {output_path}")
+        return output_path
+    
+    def register(self, source: str, path: str, output_path: str) -> str:
+        """Move a freshly written asset (from temp_path) into the cache and link it to output_path"""
+        h = self.hash_file(path)
+        
+        with self._lock:
+            cached = self.index['hashes'].get(h)
+            
+            if cached and os.path.exists(cached):
+                os.remove(path)  # same content is already cached
+            else:
+                self.blob_dir.mkdir(parents=True, exist_ok=True)
+                cached = str(self.blob_dir / f"{h}{Path(output_path).suffix}")
+                shutil.move(path, cached)
+                self.index['hashes'][h] = cached
+            
+            self.index['sources'][source] = h
+            self._save()
+        
+        self._link(cached, output_path)
+        return output_path
+    
+    def _save(self):
+        """Merge with the index on disk (other processes add to it too) and write it atomically"""
+        on_disk = self._read_index()
+        on_disk['hashes'].update(self.index['hashes'])
+        on_disk['sources'].update(self.index['sources'])
+        self.index = on_disk
+        
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, prefix="assets.", suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+    
+    @staticmethod
+    def _link(src: str, dst: str):
+        # A hardlink (or copy), never a symlink: writers replace dst rather than
+        # writing through it, so the cached blob can't be overwritten
+        if os.path.lexists(dst):
+            os.remove(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            # Cache and temp dirs on different filesystems
+            shutil.copyfile(src, dst)
+
+# ==================== TEXT CACHE ====================
+@functools.lru_cache(maxsize=16)
+def _load_font(fontsize: int, font: str = 'Arial-Bold') -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per size and share it across every overlay"""
+    for candidate in (VideoGenConfig.FONTS_DIR / f"{font}.ttf", f"{font}.ttf", "DejaVuSans-Bold.ttf"):
+        try:
+            return ImageFont.truetype(str(candidate), fontsize)
+        except OSError:
+            continue
+    
+    # Pillow's bundled scalable font at the requested size (the bitmap default
+    # is fixed at ~10px, which would shrink hook/CTA text to nothing)
+    logger.warning(f"⚠️ Font {font} not found, using Pillow default")
+    return ImageFont.load_default(size=fontsize)
+
+# Shared 1x1 canvas used only for measuring text extents
+_MEASURE_DRAW = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+
+def _measure_text(text: str, pil_font: ImageFont.FreeTypeFont, stroke_width: int = 0) -> tuple:
+    """Exact (left, top, right, bottom) of rendered text, without rasterizing it"""
+    return _MEASURE_DRAW.multiline_textbbox((0, 0), text, font=pil_font, stroke_width=stroke_width, align='center')
+
+@functools.lru_cache(maxsize=256)
+def _text_image(text: str, fontsize: int, color: str, stroke_color: str = None,
+                stroke_width: int = 1, bg_color: str = 'transparent', font: str = 'Arial-Bold') -> str:
+    """Rasterize text once with Pillow and cache it as an RGBA PNG in CACHE_DIR/textcache"""
+    key = repr((text, font, fontsize, color, stroke_color, stroke_width, bg_color)).encode('utf-8')
+    cache_dir = VideoGenConfig.CACHE_DIR / "textcache"
+    png_path = cache_dir / f"{hashlib.blake2b(key).hexdigest()[:16]}.png"
+    
+    if not png_path.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        pil_font = _load_font(fontsize, font)
+        stroke = stroke_width if stroke_color else 0
+        pad = 0 if bg_color == 'transparent' else fontsize // 5
+        
+        # Size the canvas (and the CTA's background box) from the measured bbox
+        left, top, right, bottom = _measure_text(text, pil_font, stroke)
+        img = Image.new(
+            'RGBA',
+            (right - left + 2 * pad, bottom - top + 2 * pad),
+            (0, 0, 0, 0) if bg_color == 'transparent' else bg_color
+        )
+        ImageDraw.Draw(img).multiline_text(
+            (pad - left, pad - top), text, font=pil_font, fill=color,
+            stroke_width=stroke, stroke_fill=stroke_color, align='center'
+        )
+        
+        # Write-then-rename so concurrent batch workers never read a partial PNG
+        tmp_path = png_path.with_name(f"{png_path.stem}.{os.getpid()}.{threading.get_ident()}.png")
+        img.save(tmp_path)
+        os.replace(tmp_path, png_path)
+    
+    return str(png_path)
+
+# ==================== FFMPEG HELPERS ====================
+def probe_duration(path: str) -> float:
+    """Read a media file's duration from its container with ffprobe (no decoding)"""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0', str(path)],
+        capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip())
+
+def _filter_path(path: str) -> str:
+    """Escape a file path for use as an FFmpeg filter option value"""
+    return str(path).replace('\\', '/').replace(':', '\\:').replace("'", "\\'")
 
 # ==================== VIDEO DOWNLOADER ====================
 class VideoDownloader:
@@ -104,37 +312,33 @@ class AIVoiceGenerator:
     
     def __init__(self):
         self.elevenlabs_key = VideoGenConfig.ELEVENLABS_API_KEY
+        self.cache = AssetCache.shared()
     
     def generate_elevenlabs(self, text: str, output_path: str, voice_id: str = "21m00Tcm4TlvDq8ikWAM") -> str:
-        """Generate voice using ElevenLabs (most professional)"""
-        try:
-            url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-            headers = {
-                "xi-api-key": self.elevenlabs_key,
-                "Content-Type": "application/json"
-            }
-            data = {
-                "text": text,
-                "model_id": "eleven_monolingual_v1",
-                "voice_settings": {
-                    "stability": 0.5,
-                    "similarity_boost": 0.75
-                }
+        """Generate voice using ElevenLabs (most professional) - raises on failure"""
+        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+        headers = {
+            "xi-api-key": self.elevenlabs_key,
+            "Content-Type": "application/json"
+        }
+        data = {
+            "text": text,
+            "model_id": "eleven_monolingual_v1",
+            "voice_settings": {
+                "stability": 0.5,
+                "similarity_boost": 0.75
             }
-            
-            response = requests.post(url, json=data, headers=headers)
-            
-            if response.status_code == 200:
-                with open(output_path, 'wb') as f:
-                    f.write(response.content)
-                logger.info(f"✅ Voice generated: {output_path}")
-                return output_path
-            else:
-                raise Exception(f"ElevenLabs API error: {response.status_code}")
+        }
         
-        except Exception as e:
-            logger.error(f"ElevenLabs failed: {e}, falling back to gTTS")
-            return self.generate_gtts(text, output_path)
+        response = requests.post(url, json=data, headers=headers)
+        
+        if response.status_code != 200:
+            raise Exception(f"ElevenLabs API error: {response.status_code}")
+        
+        with open(output_path, 'wb') as f:
+            f.write(response.content)
+        logger.info(f"✅ Voice generated: {output_path}")
+        return output_path
     
     def generate_gtts(self, text: str, output_path: str) -> str:
         """Fallback: Generate voice using Google TTS (free)"""
@@ -145,10 +349,29 @@ class AIVoiceGenerator:
     
     def generate_voice(self, text: str, output_path: str) -> str:
         """Main method - tries best option first"""
-        if self.elevenlabs_key:
-            return self.generate_elevenlabs(text, output_path)
-        else:
-            return self.generate_gtts(text, output_path)
+        engines = [('elevenlabs', self.generate_elevenlabs)] if self.elevenlabs_key else []
+        engines.append(('gtts', self.generate_gtts))
+        
+        for engine, synthesize in engines:
+            # Keyed on the engine that actually produced the audio, so a
+            # fallback never gets cached as an ElevenLabs voice
+            source = f"voice:{engine}:{text}"
+            if self.cache.lookup(source, output_path):
+                return output_path
+            
+            # Synthesize into a fresh file; register() moves it into the cache
+            # and links it to output_path
+            tmp_path = self.cache.temp_path(output_path)
+            try:
+                synthesize(text, tmp_path)
+            except Exception as e:
+                os.remove(tmp_path)
+                if engine == 'gtts':
+                    raise
+                logger.error(f"ElevenLabs failed: {e}, falling back to gTTS")
+                continue
+            
+            return self.cache.register(source, tmp_path, output_path)
 
 # ==================== SUBTITLE GENERATOR ====================
 class SubtitleGenerator:
@@ -172,27 +395,18 @@ class SubtitleGenerator:
         
         return words
     
-    def create_caption_clips(self, words: List[Dict], video_size: tuple) -> List[TextClip]:
-        """Create animated caption clips (TikTok style)"""
-        clips = []
-        
-        for word_data in words:
-            txt = TextClip(
-                word_data['text'].upper(),
-                fontsize=80,
-                color='white',
-                stroke_color='black',
-                stroke_width=3,
-                font='Arial-Bold',
-                method='caption',
-                size=(video_size[0] - 100, None)
-            ).set_position(('center', 'center')).set_start(word_data['start']).set_end(word_data['end'])
-            
-            # Add pop-in effect
-            txt = txt.fx(fadein, 0.1).fx(fadeout, 0.1)
-            clips.append(txt)
+    def write_srt(self, words: List[Dict], srt_path: str) -> str:
+        """Write word timestamps as an SRT file for FFmpeg's subtitles filter"""
+        def timecode(seconds: float) -> str:
+            ms = int(round(seconds * 1000))
+            return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d},{ms % 1000:03d}"
+        
+        with open(srt_path, 'w', encoding='utf-8') as f:
+            for i, word_data in enumerate(words, 1):
+                f.write(f"{i}\n{timecode(word_data['start'])} --> {timecode(word_data['end'])}\n")
+                f.write(f"{word_data['text'].strip().upper()}\n\n")
         
-        return clips
+        return srt_path
 
 # ==================== B-ROLL FETCHER ====================
 class BRollFetcher:
@@ -201,6 +415,44 @@ class BRollFetcher:
     def __init__(self):
         self.pexels_key = VideoGenConfig.PEXELS_API_KEY
         self.stability_key = VideoGenConfig.STABILITY_API_KEY
+        self.cache = AssetCache.shared()
+        self.client = self._make_client()
+    
+    @staticmethod
+    def _make_client():
+        """One pooled keep-alive client for search, download and generation calls"""
+        if httpx is None:
+            return requests.Session()
+        
+        try:
+            # HTTP/2 multiplexes requests to the same host over one TLS connection
+            return httpx.Client(http2=True, timeout=30.0, follow_redirects=True)
+        except ImportError:
+            # http2=True needs the optional 'h2' package
+            return httpx.Client(timeout=30.0, follow_redirects=True)
+    
+    def _stream_to(self, url: str, output_path: str):
+        """Stream a download to disk instead of holding the whole file in RAM"""
+        with open(output_path, 'wb') as f:
+            if httpx is not None:
+                with self.client.stream('GET', url) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(1 << 16):
+                        f.write(chunk)
+            else:
+                with self.client.get(url, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(1 << 16):
+                        f.write(chunk)
+    
+    @staticmethod
+    def _probe_duration(path: str) -> float:
+        """Container duration of a fetched clip via ffprobe (0.0 if it can't be read)"""
+        try:
+            return probe_duration(path)
+        except (OSError, ValueError, subprocess.SubprocessError) as e:
+            logger.warning(f"⚠️ ffprobe failed for {path}: {e}")
+            return 0.0
     
     def fetch_pexels_video(self, query: str, output_path: str) -> Optional[str]:
         """Download stock video from Pexels"""
@@ -208,18 +460,23 @@ class BRollFetcher:
             url = f"https://api.pexels.com/videos/search?query={query}&per_page=1&orientation=portrait"
             headers = {"Authorization": self.pexels_key}
             
-            response = requests.get(url, headers=headers)
+            response = self.client.get(url, headers=headers)
             data = response.json()
             
             if data['videos']:
                 video_url = data['videos'][0]['video_files'][0]['link']
-                video_data = requests.get(video_url)
+                if self.cache.lookup(video_url, output_path):
+                    return output_path
                 
-                with open(output_path, 'wb') as f:
-                    f.write(video_data.content)
+                tmp_path = self.cache.temp_path(output_path)
+                try:
+                    self._stream_to(video_url, tmp_path)
+                except Exception:
+                    os.remove(tmp_path)
+                    raise
                 
                 logger.info(f"✅ B-roll downloaded: {output_path}")
-                return output_path
+                return self.cache.register(video_url, tmp_path, output_path)
         
         except Exception as e:
             logger.error(f"Pexels fetch failed: {e}")
@@ -246,14 +503,17 @@ class BRollFetcher:
                 "steps": 30
             }
             
-            response = requests.post(url, json=data, headers=headers)
+            response = self.client.post(url, json=data, headers=headers, timeout=120)
             
             if response.status_code == 200:
                 image_data = response.json()['artifacts'][0]['base64']
                 import base64
                 
-                with open(output_path, 'wb') as f:
+                # Written aside and swapped in, never through an existing (linked) file
+                tmp_path = f"{output_path}.tmp"
+                with open(tmp_path, 'wb') as f:
                     f.write(base64.b64decode(image_data))
+                os.replace(tmp_path, output_path)
                 
                 logger.info(f"✅ AI image generated: {output_path}")
                 return output_path
@@ -263,6 +523,59 @@ class BRollFetcher:
         
         return None
 
+# ==================== OVERLAY TIMELINE ====================
+class OverlayTimelineClip(VideoClip):
+    """Background clip with time-gated RGBA overlays alpha-blended in NumPy"""
+    
+    def __init__(self, background, timeline: List[tuple], duration: float = None):
+        # timeline: (start, end, png_path, (x, y), fade_in) - x/y may be 'center'/'bottom'
+        # duration: output length; a shorter background loops (as with -stream_loop -1)
+        self.background = background
+        self.overlays = []
+        W, H = background.size
+        
+        for start, end, png_path, (x, y), fade_in in timeline:
+            rgba = np.asarray(Image.open(png_path).convert('RGBA'))
+            h, w = rgba.shape[:2]
+            x = (W - w) // 2 if x == 'center' else x
+            y = H - h if y == 'bottom' else y
+            
+            # Clip the overlay to the frame once, so make_frame only slices
+            x0, y0 = max(x, 0), max(y, 0)
+            x1, y1 = min(x + w, W), min(y + h, H)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            rgba = rgba[y0 - y:y1 - y, x0 - x:x1 - x]
+            
+            self.overlays.append((
+                start, end, fade_in, (slice(y0, y1), slice(x0, x1)),
+                rgba[..., :3].astype(np.float32),
+                rgba[..., 3:].astype(np.float32) / 255.0
+            ))
+        
+        super().__init__(make_frame=self._make_frame, duration=duration or background.duration)
+    
+    def _make_frame(self, t: float) -> np.ndarray:
+        bg_duration = self.background.duration
+        frame = self.background.get_frame(t % bg_duration if bg_duration else t)
+        active = [o for o in self.overlays if o[0] <= t < o[1]]
+        if not active:
+            # Text-free frames pass straight through
+            return frame
+        
+        frame = frame.copy()
+        for start, end, fade_in, region, rgb, alpha in active:
+            if fade_in and t - start < fade_in:
+                alpha = alpha * ((t - start) / fade_in)
+            dst = frame[region].astype(np.float32)
+            # dst + (src - dst) * a  ==  src * a + dst * (1 - a), in place
+            blend = np.subtract(rgb, dst)
+            np.multiply(blend, alpha, out=blend)
+            np.add(dst, blend, out=dst)
+            frame[region] = dst.astype(np.uint8)
+        
+        return frame
+
 # ==================== VIDEO COMPOSER ====================
 class VideoComposer:
     """Compose final video with all elements"""
@@ -272,109 +585,252 @@ class VideoComposer:
         self.sub_gen = SubtitleGenerator()
         self.broll = BRollFetcher()
     
-    def create_short(self, script: Dict, output_path: str) -> str:
-        """Create complete YouTube Short"""
+    # Caption style for libass (SRT scripts are laid out on a 288px-high canvas)
+    CAPTION_STYLE = "FontName=Arial,Bold=1,Fontsize=12,PrimaryColour=&H00FFFFFF,Outline=2,Alignment=5"
+    
+    def _hook_image(self, script: Dict) -> str:
+        """Hook overlay PNG (pre-wrapped - the rasterizer does not wrap lines)"""
+        # ~16 chars per line fits WIDTH - 100 at fontsize 100
+        hook_text = '\n'.join(textwrap.wrap(script['hook'].upper()[:50], width=16))
+        return _text_image(hook_text, fontsize=100, color='yellow', stroke_color='black', stroke_width=5)
+    
+    def _cta_image(self, script: Dict) -> str:
+        """CTA overlay PNG (~20 chars per line at fontsize 80)"""
+        cta_text = '\n'.join(textwrap.wrap(script['cta'].upper(), width=20))
+        return _text_image(cta_text, fontsize=80, color='white', bg_color='red')
+    
+    def _compose_via_ffmpeg(self, broll_path: Optional[str], voice_path: str, subtitle_srt: str,
+                            hook_png: str, cta_png: str, out: str, duration: float) -> str:
+        """Render the short in a single FFmpeg process - no per-frame Python"""
+        W, H, FPS = VideoGenConfig.WIDTH, VideoGenConfig.HEIGHT, VideoGenConfig.FPS
+        nvenc = VideoGenConfig.nvenc_available()
+        
+        cmd = ['ffmpeg', '-y', '-hide_banner', '-loglevel', 'error']
+        
+        if broll_path:
+            if nvenc:
+                # Decode and scale on the GPU; frames only come back for crop/text burn-in
+                cmd += ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda']
+                scale = f"scale_cuda={W}:{H}:force_original_aspect_ratio=increase,hwdownload,format=nv12"
+            else:
+                scale = f"scale={W}:{H}:force_original_aspect_ratio=increase"
+            cmd += ['-stream_loop', '-1', '-i', broll_path]
+        else:
+            # Same fallback colour as the MoviePy path
+            scale = 'null'
+            cmd += ['-f', 'lavfi', '-i', f"color=c=0x141428:s={W}x{H}:r={FPS}"]
+        
+        cmd += ['-i', voice_path, '-loop', '1', '-i', hook_png, '-loop', '1', '-i', cta_png]
+        
+        graph = (
+            f"[0:v]{scale},crop={W}:{H},setsar=1,"
+            f"subtitles={_filter_path(subtitle_srt)}:force_style='{self.CAPTION_STYLE}'[bg];"
+            f"[bg][2:v]overlay=(W-w)/2:200:enable='lt(t,3)'[hooked];"
+            f"[hooked][3:v]overlay=(W-w)/2:H-h:enable='gte(t,{max(0, duration - 3):.3f})'[v]"
+        )
+        
+        if nvenc:
+            codec = [
+                '-c:v', 'h264_nvenc', '-preset', 'p1', '-rc', 'vbr', '-cq', '24',
+                '-b:v', '4M', '-maxrate', '6M', '-bufsize', '8M', '-profile:v', 'main'
+            ]
+        else:
+            codec = ['-c:v', 'libx264', '-preset', 'medium', '-b:v', '8000k', '-tune', 'zerolatency']
+        
+        cmd += [
+            '-filter_complex', graph,
+            '-map', '[v]', '-map', '1:a',
+            '-t', f"{duration:.3f}", '-r', str(FPS),
+            *codec, '-pix_fmt', 'yuv420p',
+            '-c:a', 'aac', '-ar', str(VideoGenConfig.AUDIO_FPS),
+            '-movflags', '+faststart', '-g', str(FPS * 2),
+            out
+        ]
+        
+        subprocess.run(cmd, check=True, capture_output=True)
+        logger.info(f"✅ Video created (FFmpeg direct{', NVENC' if nvenc else ''}): {out}")
+        return out
+    
+    @staticmethod
+    def _temp_file(output_path: str, name: str) -> str:
+        """Per-short scratch file in TEMP_DIR (shorts render concurrently in batch mode)"""
+        return str(VideoGenConfig.TEMP_DIR / f"{Path(output_path).stem}_{name}")
+    
+    def _normalize_background(self, video_path: str, duration: float, output_path: str) -> str:
+        """Scale, center-crop and trim a background clip to WIDTH x HEIGHT in one FFmpeg pass"""
+        W, H = VideoGenConfig.WIDTH, VideoGenConfig.HEIGHT
+        normalized_path = self._temp_file(output_path, "background.mp4")
+        
+        cmd = ['ffmpeg', '-y', '-hide_banner', '-loglevel', 'error']
+        if VideoGenConfig.nvenc_available():
+            cmd += [
+                '-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda', '-i', video_path,
+                '-vf', f"scale_cuda={W}:{H}:force_original_aspect_ratio=increase,hwdownload,format=nv12,crop={W}:{H}",
+                '-c:v', 'h264_nvenc', '-preset', 'p1', '-cq', '23'
+            ]
+        else:
+            cmd += [
+                '-i', video_path,
+                '-vf', f"scale={W}:{H}:force_original_aspect_ratio=increase,crop={W}:{H}",
+                '-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '23'
+            ]
+        cmd += ['-t', f"{duration:.3f}", '-an', normalized_path]
+        
+        subprocess.run(cmd, check=True, capture_output=True)
+        return normalized_path
+    
+    def _create_short_ffmpeg(self, script: Dict, voice_path: str, background: Optional[str], output_path: str) -> str:
+        """FFmpeg-only variant of create_short: B-roll, captions and overlays in one pass"""
+        duration = min(probe_duration(voice_path), VideoGenConfig.DURATION)
+        
+        words = self.sub_gen.transcribe_audio(voice_path)
+        srt_path = self.sub_gen.write_srt(words, self._temp_file(output_path, "captions.srt"))
+        
+        return self._compose_via_ffmpeg(
+            background, voice_path, srt_path,
+            self._hook_image(script), self._cta_image(script),
+            output_path, duration
+        )
+    
+    def create_short(self, script: Dict, output_path: str, use_ffmpeg_direct: Optional[bool] = None) -> str:
+        """Create complete YouTube Short
+
+        use_ffmpeg_direct defaults to the single-process FFmpeg render when NVENC is
+        available; MoviePy is the fallback (and the path without a GPU).
+        """
+        W, H, FPS = VideoGenConfig.WIDTH, VideoGenConfig.HEIGHT, VideoGenConfig.FPS
+        audio = bg_reader = bg_video = final_video = None
+        
         try:
             logger.info("🎬 Starting video creation...")
             
-            # Step 1: Generate voiceover
-            voice_path = VideoGenConfig.TEMP_DIR / "voice.mp3"
-            self.voice_gen.generate_voice(script['narration'], str(voice_path))
+            # Step 1: Generate voiceover, fetching the B-roll at the same time
+            # (both are network-bound and independent of each other)
+            voice_path = self._temp_file(output_path, "voice.mp3")
+            background = script.get('source_video')
+            
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                voice_future = executor.submit(self.voice_gen.generate_voice, script['narration'], str(voice_path))
+                
+                if not background:
+                    # Option B: Fetch B-roll (Option A: trimmed source video)
+                    broll_path = self._temp_file(output_path, "broll.mp4")
+                    broll_future = executor.submit(self.broll.fetch_pexels_video, script['topic'], str(broll_path))
+                    background = broll_future.result()
+                
+                voice_future.result()
+            
+            if use_ffmpeg_direct is None:
+                use_ffmpeg_direct = VideoGenConfig.nvenc_available()
+            
+            if use_ffmpeg_direct:
+                try:
+                    return self._create_short_ffmpeg(script, str(voice_path), background, output_path)
+                except subprocess.CalledProcessError as e:
+                    # e.g. a codec the GPU can't decode: frames come back in system
+                    # memory and scale_cuda fails
+                    stderr = (e.stderr or b'').decode(errors='replace').strip()[-300:]
+                    logger.warning(f"⚠️ FFmpeg direct render failed, falling back to MoviePy: {stderr}")
             
             # Step 2: Get video duration from audio
-            audio = AudioFileClip(str(voice_path))
+            # Speech doesn't need 44.1kHz float64 - 22.05kHz 16-bit cuts the buffer ~4x
+            audio = AudioFileClip(str(voice_path), fps=VideoGenConfig.AUDIO_FPS, nbytes=2)
             duration = min(audio.duration, VideoGenConfig.DURATION)
             
             # Step 3: Create background
-            if script.get('source_video'):
-                # Option A: Use trimmed source video
-                bg_video = VideoFileClip(script['source_video'])
-                bg_video = bg_video.subclip(0, min(duration, bg_video.duration))
-            else:
-                # Option B: Fetch B-roll or generate AI background
-                broll_path = VideoGenConfig.TEMP_DIR / "broll.mp4"
-                fetched = self.broll.fetch_pexels_video(script['topic'], str(broll_path))
+            if background:
+                # Read the length from the container once instead of trusting
+                # MoviePy's header scan (falls back to the full voiceover length)
+                bg_duration = min(duration, self.broll._probe_duration(background) or duration)
                 
-                if fetched:
-                    bg_video = VideoFileClip(fetched).subclip(0, duration)
-                else:
-                    # Fallback: Solid color with zoom effect
-                    bg_video = ColorClip(
-                        size=(VideoGenConfig.WIDTH, VideoGenConfig.HEIGHT),
-                        color=(20, 20, 40),
-                        duration=duration
-                    )
-            
-            # Resize and crop to vertical format
-            bg_video = bg_video.fx(resize, height=VideoGenConfig.HEIGHT)
-            bg_video = bg_video.crop(
-                x_center=bg_video.w/2,
-                width=VideoGenConfig.WIDTH,
-                height=VideoGenConfig.HEIGHT
-            )
+                # Scale/crop/trim in FFmpeg so MoviePy never resizes frames in Python
+                normalized = self._normalize_background(background, bg_duration, output_path)
+                # One reader (one ffmpeg process) per source; consumers take subclips of it
+                bg_reader = VideoFileClip(normalized, fps_source='tbr')
+                bg_video = bg_reader.subclip(0, min(bg_duration, bg_reader.duration))
+            else:
+                # Fallback: Solid color, already at output size (one cached frame)
+                bg_video = ImageClip(np.full((H, W, 3), (20, 20, 40), dtype=np.uint8)).set_duration(duration)
             
-            # Step 4: Generate captions
+            # Step 4: Generate captions as SRT - burned in by the encoder's subtitles
+            # filter instead of compositing one clip per word in Python
             words = self.sub_gen.transcribe_audio(str(voice_path))
-            caption_clips = self.sub_gen.create_caption_clips(
-                words,
-                (VideoGenConfig.WIDTH, VideoGenConfig.HEIGHT)
-            )
-            
-            # Step 5: Add hook text at start
-            hook_clip = TextClip(
-                script['hook'].upper(),
-                fontsize=100,
-                color='yellow',
-                stroke_color='black',
-                stroke_width=5,
-                font='Arial-Bold',
-                method='caption',
-                size=(VideoGenConfig.WIDTH - 100, None)
-            ).set_position(('center', 200)).set_duration(3).fx(fadein, 0.5)
+            srt_path = self.sub_gen.write_srt(words, self._temp_file(output_path, "captions.srt"))
             
-            # Step 6: Add CTA at end
-            cta_clip = TextClip(
-                script['cta'].upper(),
-                fontsize=80,
-                color='white',
-                bg_color='red',
-                font='Arial-Bold',
-                method='caption',
-                size=(VideoGenConfig.WIDTH - 100, None)
-            ).set_position(('center', 'bottom')).set_start(duration - 3).set_duration(3)
-            
-            # Step 7: Composite everything
-            final_video = CompositeVideoClip(
-                [bg_video, hook_clip, cta_clip] + caption_clips,
-                size=(VideoGenConfig.WIDTH, VideoGenConfig.HEIGHT)
-            )
+            # Step 5-7: Hook text at start, CTA at end - blended straight into the
+            # background frames instead of a per-frame multi-layer composite
+            timeline = [
+                (0, 3, self._hook_image(script), ('center', 200), 0.5),
+                (duration - 3, duration, self._cta_image(script), ('center', 'bottom'), 0),
+            ]
+            # Runs for the full voiceover even when the B-roll is shorter (it loops)
+            final_video = OverlayTimelineClip(bg_video, timeline, duration)
             
             # Step 8: Add audio
             final_video = final_video.set_audio(audio)
             
             # Step 9: Export with optimal settings
+            # Captions are burned in by libass during the encode; moov atom up front
+            # so uploads/playback can start immediately; 2s GOP keeps Cloudinary's
+            # streaming transforms aligned
+            container_params = [
+                '-vf', f"subtitles={_filter_path(srt_path)}:force_style='{self.CAPTION_STYLE}'",
+                '-movflags', '+faststart', '-g', str(FPS * 2)
+            ]
+            
+            if VideoGenConfig.nvenc_available():
+                # Encoding runs on the NVENC ASIC, so no CPU thread count
+                encode_args = {
+                    'codec': 'h264_nvenc',
+                    'ffmpeg_params': [
+                        '-preset', 'p1', '-rc', 'vbr', '-cq', '24',
+                        '-b:v', '4M', '-maxrate', '6M', '-bufsize', '8M',
+                        '-profile:v', 'main'
+                    ] + container_params
+                }
+            else:
+                encode_args = {
+                    'codec': 'libx264',
+                    'bitrate': '8000k',
+                    'preset': 'medium',
+                    'threads': 4,
+                    'ffmpeg_params': ['-tune', 'zerolatency'] + container_params
+                }
+            
             final_video.write_videofile(
                 output_path,
-                fps=VideoGenConfig.FPS,
-                codec='libx264',
+                fps=FPS,
                 audio_codec='aac',
-                bitrate='8000k',
-                preset='medium',
-                threads=4
+                audio_fps=VideoGenConfig.AUDIO_FPS,
+                # Keep MoviePy's intermediate audio in TEMP_DIR (not the CWD) and
+                # drop it as soon as it is muxed; no progress bar or logfile
+                temp_audiofile=self._temp_file(output_path, "tmp_a.m4a"),
+                remove_temp=True,
+                write_logfile=False,
+                logger=None,
+                **encode_args
             )
             
             logger.info(f"✅ Video created: {output_path}")
             
-            # Cleanup
-            audio.close()
-            bg_video.close()
-            final_video.close()
-            
             return output_path
         
         except Exception as e:
             logger.error(f"❌ Video creation failed: {e}")
             raise
+        
+        finally:
+            # Close every clip, not just the composite - MoviePy keeps frame
+            # caches and ffmpeg readers alive on each sub-clip until closed
+            for clip in (final_video, bg_video, bg_reader, audio):
+                if clip is not None:
+                    try:
+                        clip.close()
+                    except Exception:
+                        pass
+            
+            del final_video, bg_video, bg_reader, audio
+            gc.collect()
 
 # ==================== AFFILIATE OPTIMIZER ====================
 class AffiliateOptimizer:
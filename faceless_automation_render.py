@@ -38,9 +38,15 @@ class VideoGenerationPipeline:
     """Complete video generation pipeline (Render optimized)"""
     
     def __init__(self):
+        from concurrent.futures import ThreadPoolExecutor
+        
         VideoGenConfig.init_dirs()
         self.composer = VideoComposer()
         
+        # Uploads run off the critical path so the next video can start rendering
+        self._uploader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cloudinary-upload")
+        self._pending_uploads = []
+        
         # Setup Cloudinary if available
         if VideoGenConfig.CLOUDINARY_ENABLED:
             cloudinary.config(
@@ -49,8 +55,56 @@ class VideoGenerationPipeline:
                 api_secret=os.getenv('CLOUDINARY_API_SECRET')
             )
     
-    def generate_single_video(self, script: Dict, output_filename: str = None) -> str:
-        """Generate a single video"""
+    def _upload_to_cloudinary(self, video_path: str) -> str:
+        """Upload a finished video and delete the local copy (runs on the upload pool)"""
+        try:
+            import hashlib
+            import cloudinary.api
+            import cloudinary.exceptions
+            
+            # Content hash as public_id: identical renders are uploaded once.
+            # The same handle is rewound and streamed to upload_large, so the
+            # file is opened once (upload_large needs a seekable file to size
+            # its chunks, which rules out uploading straight from a pipe)
+            with open(video_path, 'rb') as f:
+                h = hashlib.blake2b()
+                for block in iter(lambda: f.read(1 << 16), b''):
+                    h.update(block)
+                asset_hash = h.hexdigest()[:16]
+                
+                try:
+                    result = cloudinary.api.resource(
+                        f"faceless_videos/{asset_hash}",
+                        resource_type="video"
+                    )
+                    logger.info("♻️ Video already on Cloudinary, skipping upload")
+                except cloudinary.exceptions.NotFound:
+                    logger.info("☁️ Uploading to Cloudinary...")
+                    f.seek(0)
+                    result = cloudinary.uploader.upload_large(
+                        f,
+                        resource_type="video",
+                        folder="faceless_videos",
+                        public_id=asset_hash,
+                        chunk_size=6000000
+                    )
+            logger.info(f"✅ Cloudinary URL: {result['secure_url']}")
+            
+            # Delete local file after upload to save space
+            os.remove(video_path)
+            logger.info("🗑️ Local file deleted (saved to Cloudinary)")
+            
+            return result['secure_url']
+        except Exception as e:
+            logger.error(f"❌ Cloudinary upload failed: {e}")
+            return video_path
+    
+    def generate_single_video(self, script: Dict, output_filename: str = None, wait_for_upload: bool = True) -> str:
+        """Generate a single video
+        
+        With wait_for_upload=False the local path is returned straight away and
+        the Cloudinary upload finishes in the background (see drain_uploads).
+        """
         if not output_filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_filename = f"short_{timestamp}.mp4"
@@ -60,26 +114,18 @@ class VideoGenerationPipeline:
         
         # Upload to Cloudinary if enabled
         if VideoGenConfig.CLOUDINARY_ENABLED:
-            try:
-                logger.info("☁️ Uploading to Cloudinary...")
-                result = cloudinary.uploader.upload_large(
-                    video_path,
-                    resource_type="video",
-                    folder="faceless_videos",
-                    chunk_size=6000000
-                )
-                logger.info(f"✅ Cloudinary URL: {result['secure_url']}")
-                
-                # Delete local file after upload to save space
-                os.remove(video_path)
-                logger.info("🗑️ Local file deleted (saved to Cloudinary)")
-                
-                return result['secure_url']
-            except Exception as e:
-                logger.error(f"❌ Cloudinary upload failed: {e}")
+            future = self._uploader.submit(self._upload_to_cloudinary, video_path)
+            if wait_for_upload:
+                return future.result()
+            self._pending_uploads.append(future)
         
         return video_path
     
+    def drain_uploads(self) -> list:
+        """Wait for background uploads; returns Cloudinary URLs (or local paths on failure)"""
+        pending, self._pending_uploads = self._pending_uploads, []
+        return [future.result() for future in pending]
+    
     def run_full_pipeline(self, analysis: Dict) -> Dict:
         """Run full pipeline from analysis to video generation"""
         try:
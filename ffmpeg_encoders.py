@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+🎞️ FFMPEG ENCODERS - Hardware encoder detection
+Probed once per process and shared by every video composer
+"""
+
+import logging
+import subprocess
+import threading
+
+logger = logging.getLogger(__name__)
+
+_nvenc_available = None
+_probe_lock = threading.Lock()
+
+def nvenc_available() -> bool:
+    """Check whether ffmpeg has h264_nvenc and a GPU that can actually run it"""
+    global _nvenc_available
+
+    with _probe_lock:
+        if _nvenc_available is None:
+            try:
+                encoders = subprocess.run(
+                    ['ffmpeg', '-hide_banner', '-encoders'],
+                    capture_output=True, text=True, timeout=10
+                ).stdout
+
+                # Builds often list nvenc without a usable GPU, so probe with a tiny encode
+                _nvenc_available = 'h264_nvenc' in encoders and subprocess.run(
+                    ['ffmpeg', '-hide_banner', '-f', 'lavfi', '-i', 'nullsrc=s=256x256:d=0.1',
+                     '-c:v', 'h264_nvenc', '-f', 'null', '-'],
+                    capture_output=True, timeout=30
+                ).returncode == 0
+            except (OSError, subprocess.SubprocessError):
+                _nvenc_available = False
+
+            logger.info(f"🎞️ NVENC {'available' if _nvenc_available else 'not available'}")
+
+        return _nvenc_available
@@ -1,5 +1,10 @@
 import os
 
+# Block to indent: from the 'if background is None:' right after STEP 3 up to STEP 4
+START_PROBE = "if background is None:"
+START_CONTEXT = "STEP 3"
+END_PROBE = "STEP 4: Add hook text"
+
 def fix_indentation():
     file_path = 'master_automation.py'
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -9,25 +14,23 @@ def fix_indentation():
     # Line 696 in 1-based is index 695
     # We want to check if line 695 is indeed the 'if background is None:' check
     
+    # Single pass: state 0 looks for the start, state 1 looks for the end
     start_index = -1
+    end_index = -1
+    state = 0
     for i, line in enumerate(lines):
-        if "if background is None:" in line and "STEP 3" in lines[i-1]:
+        if state == 0 and START_PROBE in line and i > 0 and START_CONTEXT in lines[i-1]:
             start_index = i
+            state = 1
             print(f"Found start at line {i+1}: {line.strip()}")
+        elif state == 1 and END_PROBE in line:
+            end_index = i
+            print(f"Found end at line {i+1}: {line.strip()}")
             break
     
     if start_index == -1:
         print("Could not find the target block.")
         return
-
-    # We need to indent from start_index + 1 until we hit "STEP 4"
-    end_index = -1
-    for i in range(start_index + 1, len(lines)):
-        if "STEP 4: Add hook text" in lines[i]:
-            if "STEP 4: Add hook text" in lines[i]:
-                end_index = i
-                print(f"Found end at line {i+1}: {lines[i].strip()}")
-                break
     
     if end_index == -1:
         print("Could not find the end of the block.")
@@ -77,17 +77,16 @@ def main():
             open_browser=True
         )
         
-        # Save credentials
+        # Serialize once; the same bytes go to token.pickle and the base64 string
+        token_bytes = pickle.dumps(credentials)
+        
         with open('token.pickle', 'wb') as token:
-            pickle.dump(credentials, token)
+            token.write(token_bytes)
         
         print("\n[OK] Authorization successful!")
         print("[OK] Token saved to token.pickle\n")
         
         # Convert to base64
-        with open('token.pickle', 'rb') as token:
-            token_bytes = token.read()
-        
         token_b64 = base64.b64encode(token_bytes).decode()
         
         print("="*70)
@@ -4,23 +4,50 @@
 Full-featured server with video storage, keep-alive, and all endpoints
 """
 
-from flask import Flask, jsonify, request
+from quart import Quart, jsonify, request
+from werkzeug.exceptions import HTTPException, RequestEntityTooLarge
+import asyncio
 import threading
-import requests
+import functools
+import hashlib
+import hmac
 import time
 import os
 import sys
-from datetime import datetime, timezone
+import json
+from datetime import datetime, timedelta, timezone
 import logging
+import mmap
 from dotenv import load_dotenv
-import shutil
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
+import sqlite3
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import cloudinary
+    import cloudinary.uploader
+    import cloudinary.api
+    import cloudinary.utils
+except ImportError:
+    cloudinary = None
 
 load_dotenv()
 
+# Environment snapshot - these never change after the process starts
+ENV = {k: os.getenv(k) for k in (
+    'YOUTUBE_API_KEY', 'PIXABAY_API_KEY', 'GEMINI_API_KEY', 'ANTHROPIC_API_KEY',
+    'OPENAI_API_KEY', 'GROQ_API_KEY', 'CLOUDINARY_CLOUD_NAME', 'CLOUDINARY_API_KEY',
+    'CLOUDINARY_API_SECRET', 'AUTOMATION_TOKEN'
+)}
+_HAS_ENV = {k: bool(v) for k, v in ENV.items()}
+# Pre-encoded for hmac.compare_digest
+_EXPECTED_AUTH = f"Bearer {ENV['AUTOMATION_TOKEN'] or 'default-secret-token'}".encode('utf-8')
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -31,183 +58,580 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+app = Quart(__name__)
+# Quart caps request bodies at 16 MiB and 60 s by default; /upload takes whole
+# rendered videos, so allow video-sized bodies and slow uplinks
+app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_UPLOAD_BYTES', 512 * 1024 * 1024))
+app.config['BODY_TIMEOUT'] = 600
 app.config['START_TIME'] = time.time()
+app.config['START_MONO'] = time.monotonic()  # uptime clock, immune to NTP steps
 app.config['VIDEOS_COUNT'] = 0
 app.config['LAST_RUN'] = 'Never'
 app.config['NEXT_RUN'] = 'Scheduled'
 
-# Global lock to prevent concurrent runs (Critical for Render 512MB limit)
-AUTOMATION_LOCK = threading.Lock()
+# Global lock to prevent concurrent runs (Critical for Render 512MB limit).
+# Held on the event loop for the duration of a run, see _run_automation_locked
+AUTOMATION_LOCK = asyncio.Lock()
+
+# Set on shutdown so background loops exit instead of sleeping forever
+_stop = threading.Event()
+
+if orjson is not None:
+    from quart.json.provider import DefaultJSONProvider
+    
+    class OrjsonProvider(DefaultJSONProvider):
+        """app.json backed by orjson, so jsonify/request.get_json use it too"""
+        
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj, default=self.default).decode('utf-8')
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+    
+    app.json = OrjsonProvider(app)
+
+def ojson(obj, status: int = 200):
+    """JSON response encoded with orjson (straight to bytes), jsonify if unavailable"""
+    if orjson is None:
+        response = jsonify(obj)
+        response.status_code = status
+        return response
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
 
 # ==================== CLOUDINARY SETUP ====================
 try:
+    if cloudinary is None:
+        raise ImportError("cloudinary package not installed")
+    
     cloudinary.config(
-        cloud_name=os.getenv('CLOUDINARY_CLOUD_NAME'),
-        api_key=os.getenv('CLOUDINARY_API_KEY'),
-        api_secret=os.getenv('CLOUDINARY_API_SECRET')
+        cloud_name=ENV['CLOUDINARY_CLOUD_NAME'],
+        api_key=ENV['CLOUDINARY_API_KEY'],
+        api_secret=ENV['CLOUDINARY_API_SECRET']
     )
-    CLOUDINARY_ENABLED = bool(os.getenv('CLOUDINARY_CLOUD_NAME'))
+    CLOUDINARY_ENABLED = _HAS_ENV['CLOUDINARY_CLOUD_NAME']
     if CLOUDINARY_ENABLED:
         logger.info("✅ Cloudinary configured")
+        
+        # The uploader's module-level urllib3 pool keeps a single socket per host,
+        # so concurrent uploads (and chunk PUTs after them) re-handshake TLS.
+        # Rebuild it with room for the upload pool plus request threads.
+        if hasattr(cloudinary.uploader, '_http'):
+            cloudinary.uploader._http = cloudinary.utils.get_http_connector(
+                cloudinary.config(),
+                dict(cloudinary.CERT_KWARGS, num_pools=4, maxsize=8, retries=3)
+            )
 except Exception as e:
     CLOUDINARY_ENABLED = False
     logger.warning(f"⚠️ Cloudinary not configured: {e}")
 
+# Chunk size for chunked uploads, picked from an EWMA of observed throughput and
+# failure rate. Cloudinary rejects chunks under 5 MB, so the floor is 6 MiB; all
+# sizes stay 256 KiB multiples. Large chunks inflate retry cost, hence the 20 MiB cap
+_CHUNK_MIN = 6 * 1024 * 1024
+_CHUNK_MAX = 20 * 1024 * 1024
+_CHUNK_ALIGN = 256 * 1024
+_UPLOAD_TARGET_S = 5.0  # aim for roughly this long per chunk
+_UPLOAD_EWMA_ALPHA = 0.3
+_upload_stats = {'ewma_bw': 2e6, 'retry_rate': 0.0}
+
+class _BodyStream:
+    """Blocking front-to-back reader over a Quart request body, for worker threads
+
+    Each read pulls the next body chunks from the event loop as they arrive, so
+    a raw-body upload is forwarded without being spooled anywhere first.
+    """
+    
+    def __init__(self, body, loop, max_bytes: int = None):
+        self._body = body
+        self._loop = loop
+        self._max_bytes = max_bytes
+        self._buffer = bytearray()
+        self._received = 0
+        self._done = False
+    
+    def seekable(self) -> bool:
+        return False
+    
+    async def _next(self):
+        try:
+            return await self._body.__anext__()
+        except StopAsyncIteration:
+            return None
+    
+    def read(self, size: int = -1) -> bytes:
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            data = asyncio.run_coroutine_threadsafe(self._next(), self._loop).result()
+            if data is None:
+                self._done = True
+                break
+            self._received += len(data)
+            if self._max_bytes is not None and self._received > self._max_bytes:
+                # Chunked bodies carry no Content-Length for Quart to check up front
+                raise RequestEntityTooLarge()
+            self._buffer += data
+        
+        size = len(self._buffer) if size < 0 else size
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+def _upload_chunked(file, chunk_size: int, filename: str = None, **options):
+    """Chunked upload read front-to-back; works on pipes and request bodies (no seek)
+
+    Returns (result, bytes_sent). The total size is only sent with the last chunk;
+    earlier chunks declare it as -1, as Cloudinary's streaming uploaders do.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'rb') as f:
+            return _upload_chunked(f, chunk_size, filename or os.path.basename(file), **options)
+    
+    upload_id = cloudinary.utils.random_public_id()
+    filename = filename or getattr(file, 'filename', None) or 'stream'
+    
+    size = _stream_size(file)
+    if size is not None and size > 2 * chunk_size:
+        return _upload_chunks_parallel(file, size, chunk_size, filename, upload_id, **options), size
+    
+    result = None
+    sent = 0
+    
+    chunk = file.read(chunk_size)
+    while chunk:
+        # Read one chunk ahead so the last chunk can carry the real total
+        next_chunk = file.read(chunk_size)
+        end = sent + len(chunk)
+        total = end if not next_chunk else -1
+        
+        result = cloudinary.uploader.upload_large_part(
+            (filename, chunk),
+            http_headers={
+                "Content-Range": f"bytes {sent}-{end - 1}/{total}",
+                "X-Unique-Upload-Id": upload_id
+            },
+            **options
+        )
+        options['public_id'] = result.get('public_id')
+        
+        sent = end
+        chunk = next_chunk
+    
+    return result, sent
+
+# In-flight chunk bytes allowed across parallel workers (each worker holds one chunk)
+_PARALLEL_CHUNK_BUDGET = 64 * 1024 * 1024
+
+def _stream_size(file):
+    """Remaining bytes in a seekable stream, or None if it can't seek"""
+    try:
+        if not file.seekable():
+            return None
+        position = file.tell()
+        size = file.seek(0, os.SEEK_END) - position
+        file.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+def _upload_chunks_parallel(file, size: int, chunk_size: int, filename: str, upload_id: str, **options):
+    """Chunked upload of a seekable stream with the middle chunks sent concurrently
+
+    The first chunk goes alone (it fixes the public_id), the last one only after
+    every other chunk has landed so Cloudinary assembles a complete file.
+    """
+    base = file.tell()
+    read_lock = threading.Lock()
+    
+    def send(offset):
+        with read_lock:
+            file.seek(base + offset)
+            chunk = file.read(chunk_size)
+        return cloudinary.uploader.upload_large_part(
+            (filename, chunk),
+            http_headers={
+                "Content-Range": f"bytes {offset}-{offset + len(chunk) - 1}/{size}",
+                "X-Unique-Upload-Id": upload_id
+            },
+            **dict(options)
+        )
+    
+    offsets = list(range(0, size, chunk_size))
+    
+    result = send(offsets[0])
+    options['public_id'] = result.get('public_id')
+    
+    workers = max(1, min(4, _PARALLEL_CHUNK_BUDGET // chunk_size))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(send, offsets[1:-1]))
+    
+    return send(offsets[-1])
+
+def _pick_chunk_size() -> int:
+    """Chunk size worth ~_UPLOAD_TARGET_S of upload at the current bandwidth estimate"""
+    raw = _upload_stats['ewma_bw'] * _UPLOAD_TARGET_S * (1.0 - _upload_stats['retry_rate'])
+    return max(_CHUNK_MIN, min(_CHUNK_MAX, int(raw) // _CHUNK_ALIGN * _CHUNK_ALIGN))
+
+def _upload_with_adaptive_chunk(file, **options):
+    """Chunked upload sized from the bandwidth EWMA, which it then updates"""
+    chunk_size = _pick_chunk_size()
+    started = time.monotonic()
+    
+    try:
+        result, sent = _upload_chunked(file, chunk_size, **options)
+    except Exception:
+        # Failures push towards smaller (cheaper to repeat) chunks
+        _upload_stats['retry_rate'] += _UPLOAD_EWMA_ALPHA * (1.0 - _upload_stats['retry_rate'])
+        raise
+    
+    elapsed = max(time.monotonic() - started, 1e-3)
+    _upload_stats['ewma_bw'] += _UPLOAD_EWMA_ALPHA * (sent / elapsed - _upload_stats['ewma_bw'])
+    _upload_stats['retry_rate'] *= 1.0 - _UPLOAD_EWMA_ALPHA
+    
+    logger.info(f"📦 Uploaded {sent // 1024**2} MiB in {chunk_size // 1024**2} MiB chunks "
+                f"({sent / elapsed / 1e6:.1f} MB/s, next ~{_pick_chunk_size() // 1024**2} MiB)")
+    
+    return result
+
+# Caps blocking Cloudinary SDK calls from request handlers, so a burst of
+# uploads/listings can't take every default-executor thread
+_cloudinary_sem = asyncio.Semaphore(8)
+
+async def _cloudinary_call(fn, *args, **kwargs):
+    """Run a blocking Cloudinary SDK call in a worker thread under _cloudinary_sem"""
+    async with _cloudinary_sem:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+# Response timestamps are formatted at most once per second
+_iso_cache = {'t': 0.0, 's': ''}
+
+def _iso_now() -> str:
+    """Cached datetime.now().isoformat() at 1 s granularity"""
+    now = time.time()
+    if now - _iso_cache['t'] >= 1.0:
+        _iso_cache['s'] = datetime.fromtimestamp(now).isoformat()
+        _iso_cache['t'] = now
+    return _iso_cache['s']
+
 # ==================== ENDPOINTS ====================
 
+# Root payload is static apart from its timestamp - serialized once, and the
+# timestamp spliced in per request
+_HOME_STATIC = json.dumps({
+    'service': 'Faceless YouTube Automation',
+    'status': 'running',
+    'version': '2.0.0',
+    'message': '🚀 Full Stack Automation Live!',
+    'features': {
+        'video_generation': 'enabled',
+        'youtube_upload': 'enabled',
+        'cloudinary_storage': 'enabled' if CLOUDINARY_ENABLED else 'disabled',
+        'analytics': 'enabled',
+        'keep_alive': 'enabled'
+    },
+    'endpoints': {
+        '/health': 'Health check (for keep-alive)',
+        '/status': 'Detailed system status',
+        '/metrics': 'Prometheus-style memory and disk metrics',
+        '/trigger': 'Manually trigger automation (POST)',
+        '/stats': 'View analytics statistics',
+        '/upload': 'Upload video to Cloudinary (POST)',
+        '/videos': 'List uploaded videos'
+    }
+}, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+_HOME_TEMPLATE = b'{"timestamp":"%s",' + _HOME_STATIC[1:]
+
 @app.route('/')
-def home():
+async def home():
     """Root endpoint"""
-    return jsonify({
-        'service': 'Faceless YouTube Automation',
-        'status': 'running',
-        'version': '2.0.0',
-        'timestamp': datetime.now().isoformat(),
-        'message': '🚀 Full Stack Automation Live!',
-        'features': {
-            'video_generation': 'enabled',
-            'youtube_upload': 'enabled',
-            'cloudinary_storage': 'enabled' if CLOUDINARY_ENABLED else 'disabled',
-            'analytics': 'enabled',
-            'keep_alive': 'enabled'
-        },
-        'endpoints': {
-            '/health': 'Health check (for keep-alive)',
-            '/status': 'Detailed system status',
-            '/trigger': 'Manually trigger automation (POST)',
-            '/stats': 'View analytics statistics',
-            '/upload': 'Upload video to Cloudinary (POST)',
-            '/videos': 'List uploaded videos'
-        }
-    })
+    body = _HOME_TEMPLATE % _iso_now().encode('ascii')
+    return app.response_class(body, mimetype='application/json')
+
+# Pre-serialized /health body; only the numbers are filled in per request
+_HEALTH_TEMPLATE = b'{"status":"alive","timestamp":%f,"uptime_seconds":%f,"uptime_hours":%.2f,"healthy":true}'
 
-@app.route('/health')
-def health():
+@app.route('/health', methods=['GET', 'HEAD'])
+async def health():
     """Health check endpoint for GitHub Actions keep-alive"""
-    uptime = time.time() - app.config.get('START_TIME', time.time())
-    return jsonify({
-        'status': 'alive',
-        'timestamp': time.time(),
-        'uptime_seconds': uptime,
-        'uptime_hours': round(uptime / 3600, 2),
-        'healthy': True
-    })
+    if request.method == 'HEAD':
+        # Liveness only - no body to build for keep-alive pings
+        return '', 204
+    
+    uptime = time.monotonic() - app.config['START_MONO']
+    body = _HEALTH_TEMPLATE % (time.time(), uptime, uptime / 3600)
+    return app.response_class(body, mimetype='application/json')
+
+# Interpreter details never change; disk usage is re-read at most every 5 s
+_PY_VER = '.'.join(map(str, sys.version_info[:3]))
+_PLATFORM = sys.platform
+_STATUS_STATIC = {'python_version': _PY_VER, 'platform': _PLATFORM}
+# Environment flags reported by /status (built once from the env snapshot)
+_ENV_STATUS = {
+    'youtube_api': _HAS_ENV['YOUTUBE_API_KEY'],
+    'pixabay_api': _HAS_ENV['PIXABAY_API_KEY'],
+    'gemini_api': _HAS_ENV['GEMINI_API_KEY'],
+    'cloudinary': CLOUDINARY_ENABLED,
+    'anthropic_api': _HAS_ENV['ANTHROPIC_API_KEY'],
+    'openai_api': _HAS_ENV['OPENAI_API_KEY'],
+    'groq_api': _HAS_ENV['GROQ_API_KEY'],
+}
+_STATUS_CLOUDINARY = {
+    'enabled': CLOUDINARY_ENABLED,
+    'cloud_name': ENV['CLOUDINARY_CLOUD_NAME'] or 'not configured'
+}
+
+@functools.lru_cache(maxsize=1)
+def _disk_usage_cached(bucket: int) -> dict:
+    """Rounded disk usage of /; one statvfs per 5 s bucket (maxsize=1 drops the old one)"""
+    # Same figures as shutil.disk_usage, read straight off statvfs
+    st = os.statvfs("/")
+    total = st.f_blocks * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    return {
+        'total_gb': round(total / (1024**3), 2),
+        'used_gb': round(used / (1024**3), 2),
+        'free_gb': round(free / (1024**3), 2),
+        'percent_used': round((used / total) * 100, 2)
+    }
+
+def _disk_usage() -> dict:
+    return _disk_usage_cached(int(time.time() // 5))
 
 @app.route('/status')
-def status():
+async def status():
     """Detailed status information"""
     try:
-        # Get disk usage
-        total, used, free = shutil.disk_usage("/")
-        
-        # Check environment variables
-        env_status = {
-            'youtube_api': bool(os.getenv('YOUTUBE_API_KEY')),
-            'pixabay_api': bool(os.getenv('PIXABAY_API_KEY')),
-            'gemini_api': bool(os.getenv('GEMINI_API_KEY')),
-            'cloudinary': CLOUDINARY_ENABLED,
-            'anthropic_api': bool(os.getenv('ANTHROPIC_API_KEY')),
-            'openai_api': bool(os.getenv('OPENAI_API_KEY')),
-            'groq_api': bool(os.getenv('GROQ_API_KEY')),
-        }
-        
-        return jsonify({
+        return ojson({
             'status': 'operational',
             'automation': 'running',
             'server': {
-                'uptime_hours': round((time.time() - app.config['START_TIME']) / 3600, 2),
-                'python_version': sys.version.split()[0],
-                'platform': sys.platform
-            },
-            'disk_usage': {
-                'total_gb': round(total / (1024**3), 2),
-                'used_gb': round(used / (1024**3), 2),
-                'free_gb': round(free / (1024**3), 2),
-                'percent_used': round((used / total) * 100, 2)
+                'uptime_hours': round((time.monotonic() - app.config['START_MONO']) / 3600, 2),
+                **_STATUS_STATIC
             },
+            'disk_usage': _disk_usage(),
             'automation_stats': {
                 'last_run': app.config.get('LAST_RUN', 'Never'),
                 'next_run': app.config.get('NEXT_RUN', 'Unknown'),
                 'videos_generated': app.config.get('VIDEOS_COUNT', 0)
             },
-            'environment': env_status,
-            'cloudinary': {
-                'enabled': CLOUDINARY_ENABLED,
-                'cloud_name': os.getenv('CLOUDINARY_CLOUD_NAME', 'not configured')
-            },
-            'timestamp': datetime.now().isoformat()
+            'environment': _ENV_STATUS,
+            'cloudinary': _STATUS_CLOUDINARY,
+            'timestamp': _iso_now()
         })
     except Exception as e:
         logger.error(f"Status check failed: {e}")
-        return jsonify({
+        return ojson({
             'status': 'error',
             'message': str(e),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _iso_now()
         }), 500
 
+# /proc/meminfo fields exported by /metrics (values are in kB)
+_MEMINFO_FIELDS = ('MemTotal', 'MemFree', 'MemAvailable', 'Cached', 'Active', 'Dirty')
+# /sys/block/<dev>/stat columns exported by /metrics
+_DISKSTAT_FIELDS = ('reads_completed', 'reads_merged', 'sectors_read', 'read_time_ms',
+                    'writes_completed', 'writes_merged', 'sectors_written', 'write_time_ms')
+
+def _root_block_stat_path():
+    """sysfs stat file of the block device backing /, or None (e.g. overlayfs)"""
+    dev = os.stat('/').st_dev
+    path = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}/stat"
+    return path if os.path.exists(path) else None
+
+_ROOT_BLOCK_STAT = _root_block_stat_path() if sys.platform.startswith('linux') else None
+
+@functools.lru_cache(maxsize=1)
+def _metrics_cached(bucket: int) -> bytes:
+    """Prometheus text exposition of memory and root-disk counters, one read per 5 s bucket"""
+    lines = []
+    
+    try:
+        with open('/proc/meminfo') as f:
+            meminfo = {}
+            for line in f:
+                key, _, rest = line.partition(':')
+                if key in _MEMINFO_FIELDS:
+                    meminfo[key] = int(rest.split()[0]) * 1024
+        for key in _MEMINFO_FIELDS:
+            if key in meminfo:
+                lines.append(f"# TYPE node_memory_{key}_bytes gauge")
+                lines.append(f"node_memory_{key}_bytes {meminfo[key]}")
+    except OSError:
+        pass
+    
+    if _ROOT_BLOCK_STAT:
+        try:
+            with open(_ROOT_BLOCK_STAT) as f:
+                values = [int(v) for v in f.read().split()[:len(_DISKSTAT_FIELDS)]]
+            stat = dict(zip(_DISKSTAT_FIELDS, values))
+            for key, value in stat.items():
+                lines.append(f"# TYPE root_disk_{key}_total counter")
+                lines.append(f"root_disk_{key}_total {value}")
+            reads = stat['reads_completed'] + stat['reads_merged']
+            lines.append("# TYPE root_disk_read_merge_ratio gauge")
+            lines.append(f"root_disk_read_merge_ratio {stat['reads_merged'] / reads if reads else 0.0:.4f}")
+        except (OSError, ValueError, KeyError):
+            pass
+    
+    lines.append("# TYPE process_uptime_seconds gauge")
+    lines.append(f"process_uptime_seconds {time.monotonic() - app.config['START_MONO']:.1f}")
+    lines.append("# TYPE automation_videos_generated_total counter")
+    lines.append(f"automation_videos_generated_total {app.config.get('VIDEOS_COUNT', 0)}")
+    
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+@app.route('/metrics')
+async def metrics():
+    """Prometheus-style metrics from /proc/meminfo and the root block device"""
+    return app.response_class(
+        _metrics_cached(int(time.time() // 5)),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
+
 @app.route('/trigger', methods=['POST'])
-def trigger_automation():
+async def trigger_automation():
     """Manually trigger automation"""
     try:
         # Check authorization
         auth_header = request.headers.get('Authorization')
-        expected_token = os.getenv('AUTOMATION_TOKEN', 'default-secret-token')
         
-        if auth_header != f"Bearer {expected_token}":
-            return jsonify({'error': 'Unauthorized'}), 401
+        if not auth_header or not hmac.compare_digest(auth_header.encode('utf-8'), _EXPECTED_AUTH):
+            return ojson({'error': 'Unauthorized'}), 401
         
         logger.info("🚀 Manual automation trigger received")
         
         # Run automation in background
         if AUTOMATION_LOCK.locked():
-            return jsonify({'error': 'Automation already running', 'status': 'busy'}), 429
+            return ojson({'error': 'Automation already running', 'status': 'busy'}), 429
             
-        thread = threading.Thread(target=run_automation_once, daemon=True)
-        thread.start()
+        _spawn_automation(asyncio.get_running_loop())
         
-        return jsonify({
+        return ojson({
             'status': 'triggered',
             'message': 'Automation started in background',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _iso_now()
         })
         
     except Exception as e:
         logger.error(f"❌ Trigger failed: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}), 500
+
+# /stats reads from SQLite instead of re-parsing analytics.json on every hit.
+# AnalyticsTracker still writes the JSON file, so it is (re)imported into
+# analytics.db only when its mtime changes; reads are two indexed queries
+ANALYTICS_JSON = 'analytics.json'
+ANALYTICS_DB = 'analytics.db'
+_analytics_db = {'conn': None}
+_analytics_db_lock = threading.Lock()
+
+def _get_analytics_db():
+    """Shared SQLite connection (WAL), created with its schema on first use"""
+    if _analytics_db['conn'] is None:
+        conn = sqlite3.connect(ANALYTICS_DB, check_same_thread=False)
+        # synchronous=NORMAL is durable enough in WAL mode (the DB is a cache of
+        # analytics.json) and saves an fsync per import
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            CREATE TABLE IF NOT EXISTS totals (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_videos INTEGER NOT NULL,
+                total_views INTEGER NOT NULL,
+                platform_stats TEXT NOT NULL,
+                source_mtime INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS videos (
+                id TEXT PRIMARY KEY,
+                views INTEGER NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS videos_by_views ON videos (views DESC);
+        """)
+        _analytics_db['conn'] = conn
+    return _analytics_db['conn']
+
+def _import_analytics_json(conn, mtime: int):
+    """Replace the DB contents with analytics.json in one transaction"""
+    with open(ANALYTICS_JSON, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            # orjson parses straight out of the page cache - no bytes copy of the file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
+        else:
+            data = app.json.loads(f.read())
+    
+    rows = []
+    for i, video in enumerate(data.get('videos', [])):
+        # AnalyticsTracker stores the cross-platform total; older records need summing
+        views = video.get('total_views')
+        if views is None:
+            views = sum(video.get(p, {}).get('views', 0) for p in ('youtube', 'tiktok', 'instagram'))
+        rows.append((video.get('id') or f"vid_{i + 1}", views, app.json.dumps(video)))
+    
+    with conn:
+        conn.execute("DELETE FROM videos")
+        conn.executemany("INSERT OR REPLACE INTO videos (id, views, data) VALUES (?, ?, ?)", rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO totals (id, total_videos, total_views, platform_stats, source_mtime) "
+            "VALUES (1, ?, ?, ?, ?)",
+            (data.get('total_videos', 0), data.get('total_views', 0),
+             app.json.dumps(data.get('platform_stats', {})), mtime)
+        )
+    logger.info(f"🗄️ Imported {len(rows)} videos from {ANALYTICS_JSON} into {ANALYTICS_DB}")
+
+def _read_analytics():
+    """Stats summary from analytics.db, or None if there is no analytics data yet"""
+    try:
+        mtime = os.stat(ANALYTICS_JSON).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    
+    with _analytics_db_lock:
+        if mtime is None and not os.path.exists(ANALYTICS_DB):
+            return None
+        
+        conn = _get_analytics_db()
+        row = conn.execute("SELECT source_mtime FROM totals WHERE id = 1").fetchone()
+        if mtime is not None and (row is None or row[0] != mtime):
+            _import_analytics_json(conn, mtime)
+        
+        totals = conn.execute(
+            "SELECT total_videos, total_views, platform_stats FROM totals WHERE id = 1"
+        ).fetchone()
+        if totals is None:
+            return None
+        
+        best = conn.execute("SELECT data FROM videos ORDER BY views DESC LIMIT 5").fetchall()
+    
+    return {
+        'total_videos': totals[0],
+        'total_views': totals[1],
+        'platform_stats': app.json.loads(totals[2]),
+        'best_performing': [app.json.loads(r[0]) for r in best]
+    }
 
 @app.route('/stats')
-def stats():
+async def stats():
     """View automation statistics"""
     try:
-        import json
+        payload = await asyncio.to_thread(_read_analytics)
         
-        # Try to load analytics
-        analytics_file = 'analytics.json'
-        if os.path.exists(analytics_file):
-            with open(analytics_file, 'r') as f:
-                data = json.load(f)
-            
-            return jsonify({
-                'total_videos': data.get('total_videos', 0),
-                'total_views': data.get('total_views', 0),
-                'platform_stats': data.get('platform_stats', {}),
-                'best_performing': data.get('best_performing', [])[:5],
-                'timestamp': datetime.now().isoformat()
-            })
+        if payload is not None:
+            return ojson({**payload, 'timestamp': _iso_now()})
         else:
-            return jsonify({
+            return ojson({
                 'total_videos': 0,
                 'total_views': 0,
                 'message': 'No analytics data yet',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _iso_now()
             })
     except Exception as e:
         logger.error(f"Stats error: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}), 500
 
 @app.route('/test-ui')
-def test_ui():
+async def test_ui():
     """Mobile-friendly API testing interface"""
     html = '''
     <!-- The entire HTML from the artifact above -->
@@ -215,63 +639,101 @@ def test_ui():
     return html
     
 @app.route('/upload', methods=['POST'])
-def upload_video():
+async def upload_video():
     """Upload video to Cloudinary"""
     if not CLOUDINARY_ENABLED:
-        return jsonify({'error': 'Cloudinary not configured'}), 503
+        return ojson({'error': 'Cloudinary not configured'}), 503
     
     try:
-        if 'video' not in request.files:
-            return jsonify({'error': 'No video file provided'}), 400
-        
-        video_file = request.files['video']
-        platform = request.form.get('platform', 'youtube')
-        
-        # Save temporarily
-        temp_path = f"/tmp/{video_file.filename}"
-        video_file.save(temp_path)
+        if request.mimetype == 'multipart/form-data':
+            # Form uploads are parsed (and spooled to a temp file above 500 KB)
+            # by werkzeug before the view runs; the upload then reads that spool
+            files = await request.files
+            form = await request.form
+            
+            if 'video' not in files:
+                return ojson({'error': 'No video file provided'}), 400
+            
+            video_file = files['video']
+            source, filename = video_file.stream, video_file.filename
+            platform = form.get('platform', 'youtube')
+        else:
+            # Raw body (e.g. Content-Type: video/mp4, ?filename=...&platform=...):
+            # forwarded chunk by chunk as it arrives - nothing touches the disk
+            source = _BodyStream(request.body, asyncio.get_running_loop(), app.config['MAX_CONTENT_LENGTH'])
+            filename = request.args.get('filename', 'upload.mp4')
+            platform = request.args.get('platform', 'youtube')
         
-        logger.info(f"☁️ Uploading to Cloudinary: {video_file.filename}")
+        logger.info(f"☁️ Uploading to Cloudinary: {filename}")
         
         # Upload to Cloudinary
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         public_id = f"faceless/{platform}/{timestamp}"
         
-        result = cloudinary.uploader.upload_large(
-            temp_path,
+        # Sent in chunks read front to back; the SDK is blocking, so keep it
+        # off the event loop
+        result = await _cloudinary_call(
+            _upload_with_adaptive_chunk,
+            source,
             resource_type="video",
             public_id=public_id,
             folder="faceless_videos",
-            chunk_size=6000000
+            filename=filename
         )
         
-        # Delete local file
-        os.remove(temp_path)
-        
         logger.info(f"✅ Uploaded: {result['secure_url']}")
         
-        return jsonify({
+        # Make the new upload show up in /videos straight away
+        _videos_cache['data'] = None
+        
+        return ojson({
             'success': True,
             'url': result['secure_url'],
             'public_id': result['public_id'],
             'duration': result.get('duration'),
             'format': result.get('format'),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _iso_now()
         })
-        
+    
+    except HTTPException:
+        # e.g. 413 for a body over MAX_CONTENT_LENGTH - not a server error
+        raise
     except Exception as e:
         logger.error(f"❌ Upload failed: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}), 500
+
+# Last /videos listing from Cloudinary, reused for VIDEOS_CACHE_TTL seconds
+# (uploads invalidate it). The ETag lets polling clients revalidate with a 304
+VIDEOS_CACHE_TTL = 60
+_videos_cache = {'t': 0.0, 'data': None, 'etag': None}
+
+def _videos_response(videos, etag: str):
+    """/videos body with its ETag, or an empty 304 if the client already has it"""
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = ojson({
+            'count': len(videos),
+            'videos': videos,
+            'timestamp': _iso_now()
+        })
+    response.set_etag(etag)
+    return response
 
 @app.route('/videos')
-def list_videos():
+async def list_videos():
     """List uploaded videos from Cloudinary"""
     if not CLOUDINARY_ENABLED:
-        return jsonify({'error': 'Cloudinary not configured'}), 503
+        return ojson({'error': 'Cloudinary not configured'}), 503
     
     try:
+        # Serve from the cache to avoid a Cloudinary admin API call per poll
+        if _videos_cache['data'] is not None and time.time() - _videos_cache['t'] < VIDEOS_CACHE_TTL:
+            return _videos_response(_videos_cache['data'], _videos_cache['etag'])
+        
         # Get videos from Cloudinary
-        result = cloudinary.api.resources(
+        result = await _cloudinary_call(
+            cloudinary.api.resources,
             type="upload",
             resource_type="video",
             prefix="faceless_videos/",
@@ -286,30 +748,45 @@ def list_videos():
             'created_at': video['created_at']
         } for video in result['resources']]
         
-        return jsonify({
-            'count': len(videos),
-            'videos': videos,
-            'timestamp': datetime.now().isoformat()
-        })
+        _videos_cache['etag'] = hashlib.blake2b(
+            app.json.dumps(videos).encode('utf-8'), digest_size=8
+        ).hexdigest()
+        _videos_cache['data'] = videos
+        _videos_cache['t'] = time.time()
+        
+        return _videos_response(videos, _videos_cache['etag'])
         
     except Exception as e:
         logger.error(f"❌ List videos failed: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}), 500
+
+# Last successful debug upload, reused within the same minute so periodic
+# probes don't spend the raw-upload quota on every hit
+_debug_upload_cache = {'bucket': None, 'url': None}
 
 @app.route('/debug-cloudinary', methods=['GET'])
-def debug_cloudinary():
+async def debug_cloudinary():
     """Debug Cloudinary configuration and upload"""
     try:
         # 1. Check Config
         config_status = {
-            'cloud_name': os.getenv('CLOUDINARY_CLOUD_NAME'),
-            'api_key': os.getenv('CLOUDINARY_API_KEY')[:5] + '...' if os.getenv('CLOUDINARY_API_KEY') else None,
-            'api_secret': 'Set' if os.getenv('CLOUDINARY_API_SECRET') else 'Missing',
+            'cloud_name': ENV['CLOUDINARY_CLOUD_NAME'],
+            'api_key': ENV['CLOUDINARY_API_KEY'][:5] + '...' if ENV['CLOUDINARY_API_KEY'] else None,
+            'api_secret': 'Set' if ENV['CLOUDINARY_API_SECRET'] else 'Missing',
             'enabled': CLOUDINARY_ENABLED
         }
         
         if not CLOUDINARY_ENABLED:
-            return jsonify({'status': 'disabled', 'config': config_status}), 200
+            return ojson({'status': 'disabled', 'config': config_status}), 200
+        
+        bucket = int(time.time() // 60)
+        if _debug_upload_cache['bucket'] == bucket:
+            return ojson({
+                'status': 'success',
+                'url': _debug_upload_cache['url'],
+                'config': config_status,
+                'cached': True
+            })
             
         # 2. Create dummy file
         dummy_path = "debug_test.txt"
@@ -318,7 +795,8 @@ def debug_cloudinary():
             
         # 3. Try Upload
         logger.info("🧪 Starting debug upload...")
-        result = cloudinary.uploader.upload(
+        result = await _cloudinary_call(
+            cloudinary.uploader.upload,
             dummy_path,
             resource_type="raw",
             public_id=f"debug/test_{int(time.time())}",
@@ -328,8 +806,11 @@ def debug_cloudinary():
         # 4. Cleanup
         if os.path.exists(dummy_path):
             os.remove(dummy_path)
+        
+        _debug_upload_cache['bucket'] = bucket
+        _debug_upload_cache['url'] = result.get('secure_url')
             
-        return jsonify({
+        return ojson({
             'status': 'success',
             'url': result.get('secure_url'),
             'config': config_status
@@ -337,19 +818,28 @@ def debug_cloudinary():
         
     except Exception as e:
         logger.error(f"❌ Debug upload failed: {e}")
-        return jsonify({
+        return ojson({
             'status': 'error',
             'message': str(e),
             'config': config_status
         }), 500
 
+# The render pipeline (and its heavy imports) is built once, on the first /debug-video hit
+_debug_pipeline = None
+
+def _get_debug_pipeline():
+    """Shared VideoGenerationPipeline, imported and constructed on first use"""
+    global _debug_pipeline
+    if _debug_pipeline is None:
+        from faceless_automation_render import VideoGenerationPipeline
+        _debug_pipeline = VideoGenerationPipeline()
+    return _debug_pipeline
+
 @app.route('/debug-video', methods=['GET'])
-def debug_video():
+async def debug_video():
     """Debug video generation (1 second test)"""
     try:
-        from faceless_automation_render import VideoGenerationPipeline
-        
-        pipeline = VideoGenerationPipeline()
+        pipeline = await asyncio.to_thread(_get_debug_pipeline)
         
         # Simple 1-second script
         script = {
@@ -365,9 +855,9 @@ def debug_video():
         
         # Generate
         logger.info("🧪 Starting debug video generation...")
-        video_path = pipeline.generate_single_video(script, f"debug_{int(time.time())}.mp4")
+        video_path = await asyncio.to_thread(pipeline.generate_single_video, script, f"debug_{int(time.time())}.mp4")
         
-        return jsonify({
+        return ojson({
             'status': 'success',
             'result': video_path,
             'is_url': video_path.startswith('http')
@@ -376,100 +866,201 @@ def debug_video():
     except Exception as e:
         logger.error(f"❌ Debug video failed: {e}")
         import traceback
-        return jsonify({
+        return ojson({
             'status': 'error',
             'message': str(e),
             'traceback': traceback.format_exc()
         }), 500
 
-def run_automation_once():
-    """Run automation cycle once"""
+# master_automation is heavy (MoviePy, AI clients) and imports lazily on first run
+_MasterOrchestrator = None
+# One orchestrator for the process, so its pooled HTTP session and the YouTube
+# client's authenticated connection survive between runs
+_orchestrator = None
+
+def _get_orchestrator_cls():
+    """Import MasterOrchestrator once, on first use"""
+    global _MasterOrchestrator
+    if _MasterOrchestrator is None:
+        from master_automation import MasterOrchestrator
+        _MasterOrchestrator = MasterOrchestrator
+    return _MasterOrchestrator
+
+def _get_orchestrator():
+    """Shared MasterOrchestrator, built on the first run (callers hold AUTOMATION_LOCK)"""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = _get_orchestrator_cls()()
+    return _orchestrator
+
+# Strong references to in-flight automation tasks (the loop only keeps weak ones)
+_automation_tasks = set()
+
+# How long shutdown waits for a running cycle (Render sends SIGKILL after 30 s)
+SHUTDOWN_GRACE_S = 25
+
+def _spawn_automation(loop):
+    """Start _run_automation_locked as a task on loop and return immediately"""
+    task = loop.create_task(_run_automation_locked())
+    _automation_tasks.add(task)
+    task.add_done_callback(_automation_tasks.discard)
+
+async def _run_automation_locked():
+    """Run one automation cycle in a worker thread while holding AUTOMATION_LOCK"""
     if AUTOMATION_LOCK.locked():
         logger.warning("⚠️ Automation already running, skipping this run")
         return
+    
+    async with AUTOMATION_LOCK:
+        await asyncio.get_running_loop().run_in_executor(None, run_automation_once)
 
-    with AUTOMATION_LOCK:
-        try:
-            logger.info("🚀 Starting automation cycle...")
-            app.config['LAST_RUN'] = datetime.now().isoformat()
-            
-            # Import here to avoid circular imports
-            # Use render-optimized version
-            import sys
-            if 'faceless_automation_render' not in sys.modules:
-                logger.info("📦 Using Render-optimized pipeline")
-            
-            from master_automation import MasterOrchestrator
-            
-            orchestrator = MasterOrchestrator()
-            results = orchestrator.run_daily_automation()
-            
-            app.config['VIDEOS_COUNT'] = app.config.get('VIDEOS_COUNT', 0) + 1
-            
-            # Cloudinary upload is handled within master_automation.py
-            if results.get('cloudinary_url'):
-                logger.info(f"✅ Video available at: {results['cloudinary_url']}")
-            
-            if results.get('status') == 'success':
-                 logger.info("✅ Automation cycle completed successfully")
-            else:
-                 logger.warning("⚠️ Automation cycle completed with warnings")
-            
-            logger.info("✅ Automation cycle complete")
-            
-        except Exception as e:
-            logger.error(f"❌ Automation cycle failed: {e}")
+def run_automation_once():
+    """Run automation cycle once (blocking - callers hold AUTOMATION_LOCK)"""
+    try:
+        logger.info("🚀 Starting automation cycle...")
+        app.config['LAST_RUN'] = datetime.now().isoformat()
+        _record_run_start()
+        
+        # Use render-optimized version
+        if 'faceless_automation_render' not in sys.modules:
+            logger.info("📦 Using Render-optimized pipeline")
+        
+        orchestrator = _get_orchestrator()
+        results = orchestrator.run_daily_automation()
+        
+        if results.get('status') == 'skipped':
+            logger.info(f"♻️ Automation cycle skipped: {results.get('reason')}")
+            return
+        
+        app.config['VIDEOS_COUNT'] = app.config.get('VIDEOS_COUNT', 0) + 1
+        
+        # Cloudinary upload is handled within master_automation.py
+        if results.get('cloudinary_url'):
+            logger.info(f"✅ Video available at: {results['cloudinary_url']}")
+        
+        if results.get('status') == 'success':
+             logger.info("✅ Automation cycle completed successfully")
+        else:
+             logger.warning("⚠️ Automation cycle completed with warnings")
+        
+        logger.info("✅ Automation cycle complete")
+        
+    except Exception as e:
+        logger.error(f"❌ Automation cycle failed: {e}")
+
+# Daily run times (UTC hours)
+SCHEDULED_HOURS = (9, 14, 19)
+
+# Start time of the last run, persisted so a restart can tell whether the most
+# recent slot already ran. Missed slots are coalesced: at most one catch-up run
+LAST_RUN_FILE = 'last_automation_run.txt'
+MISFIRE_GRACE_S = 3600
+
+def _record_run_start():
+    """Persist the current UTC time as the last run start (write-then-rename)"""
+    try:
+        tmp_file = f"{LAST_RUN_FILE}.tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(datetime.now(timezone.utc).isoformat())
+        os.replace(tmp_file, LAST_RUN_FILE)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not record run time: {e}")
+
+def _read_last_run():
+    """Last persisted run start (UTC), or None"""
+    try:
+        with open(LAST_RUN_FILE) as f:
+            return datetime.fromisoformat(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def _previous_run_time() -> datetime:
+    """Most recent scheduled slot at or before now (UTC)"""
+    now = datetime.now(timezone.utc)
+    candidates = []
+    for hour in SCHEDULED_HOURS:
+        run_at = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if run_at > now:
+            run_at -= timedelta(days=1)
+        candidates.append(run_at)
+    return max(candidates)
+
+def _next_run_time() -> datetime:
+    """Next scheduled run after now (UTC)"""
+    now = datetime.now(timezone.utc)
+    candidates = []
+    for hour in SCHEDULED_HOURS:
+        run_at = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if run_at <= now:
+            run_at += timedelta(days=1)
+        candidates.append(run_at)
+    return min(candidates)
+
+# Pending loop.call_at handle for the next scheduled run
+_scheduler = {'handle': None}
 
-def self_ping():
-    """Ping self every 10 minutes to stay awake"""
-    base_url = os.getenv('RENDER_EXTERNAL_URL', 'http://localhost:5000')
+def _schedule_next_run(loop):
+    """Arm a single loop.call_at timer for the next scheduled run"""
+    if _stop.is_set():
+        return
     
-    logger.info(f"💓 Self-ping started: {base_url}")
+    next_run = _next_run_time()
+    delay = (next_run - datetime.now(timezone.utc)).total_seconds()
+    app.config['NEXT_RUN'] = next_run.isoformat()
     
-    while True:
-        try:
-            time.sleep(600)  # Wait 10 minutes
-            response = requests.get(f"{base_url}/health", timeout=10)
-            
-            if response.status_code == 200:
-                logger.info(f"✅ Self-ping at {datetime.now().strftime('%H:%M:%S')}")
-            else:
-                logger.warning(f"⚠️ Self-ping returned {response.status_code}")
-                
-        except Exception as e:
-            logger.error(f"❌ Self-ping failed: {e}")
-def start_scheduled_automation():
+    # call_at runs on the loop's monotonic clock - convert the wall-clock delay once
+    _scheduler['handle'] = loop.call_at(loop.time() + max(0.0, delay), _fire_and_reschedule, loop)
+    logger.info(f"⏰ Next automation run at {next_run.strftime('%Y-%m-%d %H:%M')} UTC")
+
+def _fire_and_reschedule(loop):
+    """Timer callback: re-arm for the next slot, then run this one off the loop"""
+    if _stop.is_set():
+        return
+    _schedule_next_run(loop)
+    _spawn_automation(loop)
+
+def start_scheduled_automation(loop):
     """Start automation scheduler"""
-    import schedule
-    
     logger.info("⏰ Starting automation scheduler...")
     
-    # Schedule daily runs (UTC times)
-    schedule.every().day.at("09:00").do(run_automation_once)
-    schedule.every().day.at("14:00").do(run_automation_once)
-    schedule.every().day.at("19:00").do(run_automation_once)
-    
+    # Schedule daily runs (UTC times) - event-loop timers, no wakeups in between
     logger.info("✅ Scheduled: 9 AM, 2 PM, 7 PM UTC daily")
     
-    # NEW: Check if we should run immediately (within 30 min of scheduled time)
-    from datetime import datetime
+    # Catch up on the latest slot if it was missed (process down at fire time)
+    # and is still within the grace window; older misses are dropped
     now = datetime.now(timezone.utc)
-    current_hour = now.hour
-    current_minute = now.minute
+    previous_slot = _previous_run_time()
+    last_run = _read_last_run()
+    if last_run is not None:
+        app.config['LAST_RUN'] = last_run.isoformat()
     
-    scheduled_hours = [9, 14, 19]
-    for hour in scheduled_hours:
-        if current_hour == hour and current_minute < 30:
-            logger.info(f"🚀 Running missed {hour}:00 schedule...")
-            threading.Thread(target=run_automation_once, daemon=True).start()
-            break
+    if (last_run is None or last_run < previous_slot) and (now - previous_slot).total_seconds() <= MISFIRE_GRACE_S:
+        logger.info(f"🚀 Running missed {previous_slot.hour}:00 schedule...")
+        _spawn_automation(loop)
     
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+    _schedule_next_run(loop)
 
 # ==================== STARTUP ====================
 
+@app.before_serving
+async def _startup():
+    """Run start-up checks and arm the scheduler on the server's event loop"""
+    initialize_app()
+
+@app.after_serving
+async def _shutdown():
+    """Stop background timers and release the orchestrator"""
+    _stop.set()
+    if _scheduler['handle'] is not None:
+        _scheduler['handle'].cancel()
+    
+    # A run still in the executor is using the orchestrator's B-roll session:
+    # give it a bounded chance to finish, and never close it underneath a run
+    if _automation_tasks:
+        await asyncio.wait(set(_automation_tasks), timeout=SHUTDOWN_GRACE_S)
+    if _orchestrator is not None and not AUTOMATION_LOCK.locked():
+        _orchestrator.close()
+
 def initialize_app():
     """Initialize application on startup"""
     logger.info("\n" + "="*60)
@@ -480,7 +1071,7 @@ def initialize_app():
     logger.info("\n🔍 Checking environment...")
     
     required_vars = ['YOUTUBE_API_KEY', 'PIXABAY_API_KEY', 'GEMINI_API_KEY']
-    missing = [var for var in required_vars if not os.getenv(var)]
+    missing = [var for var in required_vars if not _HAS_ENV[var]]
     
     if missing:
         logger.warning(f"⚠️ Missing required vars: {', '.join(missing)}")
@@ -496,22 +1087,18 @@ def initialize_app():
     }
     
     for var, name in optional_vars.items():
-        if os.getenv(var):
+        if _HAS_ENV[var]:
             logger.info(f"✅ {name} configured")
         else:
             logger.warning(f"⚠️ {name} not configured (optional)")
     
-    # Start background threads
+    # Start background services
     logger.info("\n🔧 Starting background services...")
     
-    # 1. Self-ping to stay awake
-    ping_thread = threading.Thread(target=self_ping, daemon=True)
-    ping_thread.start()
-    logger.info("✅ Self-ping thread started")
+    # Keep-alive pings come from .github/workflows/keep-alive.yml, outside the process
     
-    # 2. Scheduled automation
-    automation_thread = threading.Thread(target=start_scheduled_automation, daemon=True)
-    automation_thread.start()
+    # Scheduled automation
+    start_scheduled_automation(asyncio.get_running_loop())
     logger.info("✅ Automation scheduler started")
     
     logger.info("\n" + "="*60)
@@ -521,16 +1108,15 @@ def initialize_app():
 # ==================== MAIN ====================
 
 if __name__ == '__main__':
-    initialize_app()
-    
-    # Run Flask server
     port = int(os.environ.get('PORT', 5000))
     
-    logger.info(f"🌐 Starting Flask server on port {port}...")
-    
-    app.run(
-        host='0.0.0.0',
-        port=port,
-        debug=False,
-        threaded=True
-        )
+    # ASGI: one event loop multiplexes the I/O-bound endpoints
+    # (production runs the same app under uvicorn, see render.yaml)
+    try:
+        import uvicorn
+        logger.info(f"🌐 Starting uvicorn on port {port}...")
+        uvicorn.run(app, host='0.0.0.0', port=port, loop='auto', http='auto')
+    except ImportError:
+        logger.warning("⚠️ uvicorn not installed, falling back to Quart dev server")
+        logger.info(f"🌐 Starting Quart server on port {port}...")
+        app.run(host='0.0.0.0', port=port, debug=False)
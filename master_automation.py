@@ -14,9 +14,15 @@ import sys
 import json
 import logging
 import asyncio
+import threading
 import requests
 import urllib.parse
 import random
+import time
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List
@@ -38,48 +44,73 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Import AI Video Generator (Kling/Runway/Replicate/Pixverse)
-try:
-    from ai_video_manager_updated import AIVideoGenerator
-    AI_VIDEO_AVAILABLE = True
-    logger.info("✅ AI Video Generator available (Kling/Runway/Replicate/Pixverse)")
-except ImportError:
-    logger.warning("⚠️ AI Video Generator not found")
-    AI_VIDEO_AVAILABLE = False
+import ffmpeg_encoders
 
-try:
-    from avatar_variation_manager import AvatarVariationManager
-    AVATAR_VARIATION_AVAILABLE = True
-except ImportError:
-    logger.warning("⚠️ Avatar variation manager not found")
-    AVATAR_VARIATION_AVAILABLE = False
+BANNER = "=" * 80
 
-try:
-    from youtube_seo_manager import YouTubeSEOManager
-    SEO_MANAGER_AVAILABLE = True
-except ImportError:
-    logger.warning("⚠️ YouTube SEO manager not found")
-    SEO_MANAGER_AVAILABLE = False
+# Optional sub-modules are imported on first use (_load_optional_modules), so
+# importing this module - e.g. just for VideoComposerFixed - doesn't pay for them
+AI_VIDEO_AVAILABLE = False
+AVATAR_VARIATION_AVAILABLE = False
+SEO_MANAGER_AVAILABLE = False
+TEMPLATES_AVAILABLE = False
+_optional_modules_loaded = False
 
-# Import content templates for variation
-try:
-    from content_templates import (
-        generate_unique_script,
-        get_timestamp_based_script,
-        get_random_color_scheme,
-        get_timestamp_color_scheme
-    )
-    TEMPLATES_AVAILABLE = True
-except ImportError:
-    logger.warning("⚠️ content_templates.py not found, using basic variation")
-    TEMPLATES_AVAILABLE = False
+def _load_optional_modules():
+    """Import the optional sub-modules once and set their *_AVAILABLE flags"""
+    global _optional_modules_loaded, AIVideoGenerator, AvatarVariationManager, YouTubeSEOManager
+    global generate_unique_script, get_timestamp_based_script, get_random_color_scheme, get_timestamp_color_scheme
+    global AI_VIDEO_AVAILABLE, AVATAR_VARIATION_AVAILABLE, SEO_MANAGER_AVAILABLE, TEMPLATES_AVAILABLE
+    
+    if _optional_modules_loaded:
+        return
+    _optional_modules_loaded = True
+    
+    # Import AI Video Generator (Kling/Runway/Replicate/Pixverse)
+    try:
+        from ai_video_manager_updated import AIVideoGenerator
+        AI_VIDEO_AVAILABLE = True
+        logger.info("✅ AI Video Generator available (Kling/Runway/Replicate/Pixverse)")
+    except ImportError:
+        logger.warning("⚠️ AI Video Generator not found")
+        AI_VIDEO_AVAILABLE = False
+    
+    try:
+        from avatar_variation_manager import AvatarVariationManager
+        AVATAR_VARIATION_AVAILABLE = True
+    except ImportError:
+        logger.warning("⚠️ Avatar variation manager not found")
+        AVATAR_VARIATION_AVAILABLE = False
+    
+    try:
+        from youtube_seo_manager import YouTubeSEOManager
+        SEO_MANAGER_AVAILABLE = True
+    except ImportError:
+        logger.warning("⚠️ YouTube SEO manager not found")
+        SEO_MANAGER_AVAILABLE = False
+    
+    # Import content templates for variation
+    try:
+        from content_templates import (
+            generate_unique_script,
+            get_timestamp_based_script,
+            get_random_color_scheme,
+            get_timestamp_color_scheme
+        )
+        TEMPLATES_AVAILABLE = True
+    except ImportError:
+        logger.warning("⚠️ content_templates.py not found, using basic variation")
+        TEMPLATES_AVAILABLE = False
 
 # ==================== YOUTUBE TRANSCRIPT ====================
 class YouTubeTranscriptFixer:
     """Fixed YouTube transcript extraction"""
     
-    @staticmethod
-    def get_transcript(video_id: str) -> str:
+    # The analyzer only sends transcript[:5000], so stop collecting a bit past that
+    MAX_CHARS = 6000
+    
+    @classmethod
+    def get_transcript(cls, video_id: str) -> str:
         """Get transcript with working implementation"""
         try:
             from youtube_transcript_api import YouTubeTranscriptApi
@@ -96,7 +127,18 @@ class YouTubeTranscriptFixer:
                     transcript = next(iter(transcript_list))
                 
                 captions = transcript.fetch()
-                full_text = " ".join([item['text'] for item in captions])
+                
+                # Built incrementally and cut off at MAX_CHARS, so a long video
+                # never materializes its whole caption text
+                buf = io.StringIO()
+                for item in captions:
+                    buf.write(item['text'])
+                    if buf.tell() >= cls.MAX_CHARS:
+                        break
+                    buf.write(" ")
+                del captions
+                
+                full_text = buf.getvalue().rstrip()
                 logger.info(f"✅ Transcript retrieved: {len(full_text)} chars")
                 return full_text
                 
@@ -111,11 +153,58 @@ class YouTubeTranscriptFixer:
             logger.error(f"❌ Transcript error: {e}")
             return None
 
+# ==================== RESULT CACHE ====================
+class ResultCache:
+    """Small in-process LRU cache whose entries also expire after ttl seconds"""
+    
+    def __init__(self, maxsize: int = 100, ttl: float = 30 * 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(*parts) -> str:
+        """Stable cache key for any repr-able arguments"""
+        return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+    
+    def get(self, key: str):
+        """Cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self._data.pop(key, None)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: str, value):
+        """Store value (evicting the least recently used entry) and return it"""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+    
+    def stats(self) -> dict:
+        """Entry count plus hit/miss counters, for the run log"""
+        return {'size': len(self._data), 'hits': self.hits, 'misses': self.misses}
+
+# LLM analyses keyed on the prompt text actually sent; shared by every analyzer
+_analysis_cache = ResultCache(maxsize=100, ttl=30 * 60)
+
 # ==================== SAFE ANALYZER (GROQ + GEMINI FLASH 8B) ====================
 class SafeAnalyzer:
     """Analyze content with Groq (primary) and Gemini Flash 8B (fallback) - FREE TIER OPTIMIZED"""
     
     def __init__(self):
+        _load_optional_modules()
+        
         # Initialize Groq (Primary - Free tier)
         self.groq_client = None
         groq_key = os.getenv('GROQ_API_KEY', '').strip()
@@ -154,6 +243,13 @@ IMPORTANT: Return ONLY the JSON object, nothing else."""
         
         full_prompt = f"{prompt}\n\nTranscript:\n{transcript[:5000]}"
         
+        # Same transcript, same paid LLM call - reuse a recent answer
+        cache_key = ResultCache.key(full_prompt)
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None:
+            logger.info("♻️ Using cached analysis")
+            return dict(cached)
+        
         # Try 1: Groq (Fast + Free)
         if self.groq_client:
             try:
@@ -172,7 +268,7 @@ IMPORTANT: Return ONLY the JSON object, nothing else."""
                 if json_match:
                     analysis = json.loads(json_match.group())
                     logger.info("✅ Groq analysis complete")
-                    return self._ensure_fields(analysis)
+                    return dict(_analysis_cache.put(cache_key, self._ensure_fields(analysis)))
             
             except Exception as e:
                 logger.warning(f"⚠️ Groq failed: {e}, trying Gemini...")
@@ -190,7 +286,7 @@ IMPORTANT: Return ONLY the JSON object, nothing else."""
                 if json_match:
                     analysis = json.loads(json_match.group())
                     logger.info("✅ Gemini analysis complete")
-                    return self._ensure_fields(analysis)
+                    return dict(_analysis_cache.put(cache_key, self._ensure_fields(analysis)))
             
             except Exception as e:
                 logger.warning(f"⚠️ Gemini failed: {e}")
@@ -277,13 +373,48 @@ IMPORTANT: Return ONLY the JSON object, nothing else."""
 class BRollFetcher:
     """Fetch stock footage with URL encoding - 512MB optimized"""
     
+    # Clip downloads in flight at once (bounded so a large count can't
+    # saturate the instance's bandwidth and the session's connection pool)
+    MAX_PARALLEL_DOWNLOADS = 4
+    
     def __init__(self):
         self.pexels_key = os.getenv('PEXELS_API_KEY', '').strip()
         self.pixabay_key = os.getenv('PIXABAY_API_KEY', '').strip()
+        
+        # One pooled session so searches and downloads reuse the same HTTPS sockets
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def _download(self, video_url: str, output_path: str) -> Optional[str]:
+        """Stream one clip to disk; returns the path if it looks like a real video"""
+        try:
+            with self.session.get(video_url, timeout=60, stream=True) as video_response:
+                video_response.raise_for_status()
+                
+                with open(output_path, 'wb') as f:
+                    for chunk in video_response.iter_content(1 << 16):
+                        f.write(chunk)
+            
+            file_size = os.path.getsize(output_path)
+            if file_size > 100000:
+                logger.info(f"✅ Clip downloaded: {os.path.basename(output_path)} ({file_size/1024/1024:.2f}MB)")
+                return output_path
+            
+            os.remove(output_path)
+        
+        except Exception as e:
+            logger.warning(f"⚠️ Failed download: {str(e)[:100]}")
+            if os.path.exists(output_path):
+                os.remove(output_path)
+        
+        return None
     
     def fetch_broll_sequence(self, query: str, count: int, output_dir: str) -> List[str]:
         """Fetch B-roll videos with robust fallbacks"""
         clips_paths = []
+        next_index = 0
         
         logger.info(f"🎬 Fetching {count} B-roll clips for: '{query}'")
         
@@ -302,7 +433,7 @@ class BRollFetcher:
                     url = f"https://api.pexels.com/videos/search?query={query_encoded}&per_page={count}&orientation=portrait"
                     headers = {"Authorization": self.pexels_key}
                     
-                    response = requests.get(url, headers=headers, timeout=15)
+                    response = self.session.get(url, headers=headers, timeout=15)
                     
                     if response.status_code == 200:
                         data = response.json()
@@ -310,43 +441,27 @@ class BRollFetcher:
                         if data.get('videos'):
                             logger.info(f"✅ Pexels found {len(data['videos'])} videos")
                             
-                            for i, video in enumerate(data['videos']):
-                                if len(clips_paths) >= count: break
+                            urls, paths = [], []
+                            for video in data['videos'][:count - len(clips_paths)]:
+                                video_files = video['video_files']
+                                
+                                # Choose 720p or lower for memory efficiency
+                                valid_files = [f for f in video_files if f.get('width') and f['width'] <= 1920]
+                                if not valid_files:
+                                    valid_files = video_files
                                 
-                                try:
-                                    video_files = video['video_files']
-                                    
-                                    # Choose 720p or lower for memory efficiency
-                                    valid_files = [f for f in video_files if f.get('width') and f['width'] <= 1920]
-                                    if not valid_files:
-                                        valid_files = video_files
-                                    
-                                    best_file = min(valid_files, key=lambda x: abs(x.get('width', 0) - 720))
-                                    video_url = best_file['link']
-                                    
-                                    gc.collect()
-                                    
-                                    output_path = os.path.join(output_dir, f"broll_{len(clips_paths)}.mp4")
-                                    
-                                    logger.info(f"📥 Downloading clip {len(clips_paths)+1}...")
-                                    video_response = requests.get(video_url, timeout=60, stream=True)
-                                    video_response.raise_for_status()
-                                    
-                                    with open(output_path, 'wb') as f:
-                                        for chunk in video_response.iter_content(chunk_size=8192):
-                                            f.write(chunk)
-                                    
-                                    file_size = os.path.getsize(output_path)
-                                    if os.path.exists(output_path) and file_size > 100000:
-                                        clips_paths.append(output_path)
-                                        logger.info(f"✅ Clip {len(clips_paths)}/{count} downloaded: {file_size/1024/1024:.2f}MB")
-                                    else:
-                                        if os.path.exists(output_path):
-                                            os.remove(output_path)
-                                        
-                                except Exception as e:
-                                    logger.warning(f"⚠️ Failed download: {str(e)[:100]}")
-                                    continue
+                                best_file = min(valid_files, key=lambda x: abs(x.get('width', 0) - 720))
+                                urls.append(best_file['link'])
+                                paths.append(os.path.join(output_dir, f"broll_{next_index}.mp4"))
+                                next_index += 1
+                            
+                            if urls:
+                                logger.info(f"📥 Downloading {len(urls)} clips in parallel...")
+                                with ThreadPoolExecutor(max_workers=min(len(urls), self.MAX_PARALLEL_DOWNLOADS)) as executor:
+                                    downloaded = list(executor.map(self._download, urls, paths))
+                                
+                                clips_paths.extend(path for path in downloaded if path)
+                                logger.info(f"✅ {len(clips_paths)}/{count} clips ready")
                             
                             if len(clips_paths) >= count:
                                 return clips_paths
@@ -360,47 +475,144 @@ class BRollFetcher:
 class VideoComposerFixed:
     """MoviePy 2.x compatible - B-roll Priority Chain"""
     
+    # One event loop for every Edge-TTS call in the process (asyncio.run builds
+    # and tears down a fresh loop each time); the lock serializes its users
+    _loop = None
+    _loop_lock = threading.Lock()
+    
+    VOICES = ["en-US-ChristopherNeural", "en-US-GuyNeural", "en-US-AriaNeural"]
+    
+    # Background frame (9:16 Short). The normalize filter only depends on it,
+    # so it is built once here rather than per clip
+    BG_WIDTH = 720
+    BG_HEIGHT = 1280
+    NORMALIZE_VF = (
+        f"scale={BG_WIDTH}:{BG_HEIGHT}:force_original_aspect_ratio=decrease,"
+        f"pad={BG_WIDTH}:{BG_HEIGHT}:(ow-iw)/2:(oh-ih)/2:black,setsar=1"
+    )
+    
     def __init__(self):
         self.broll_fetcher = BRollFetcher()
     
+    @staticmethod
+    def nvenc_available() -> bool:
+        """Hardware H.264 encoder check (one probe per process, shared with the other composers)"""
+        return ffmpeg_encoders.nvenc_available()
+    
+    @classmethod
+    def _run(cls, coro):
+        """Run a coroutine to completion on the shared event loop"""
+        with cls._loop_lock:
+            if cls._loop is None or cls._loop.is_closed():
+                cls._loop = asyncio.new_event_loop()
+            return cls._loop.run_until_complete(coro)
+    
+    def generate_voice_batch(self, texts: List[str], paths: List[str], voice: str = None) -> List[bool]:
+        """Synthesize several narrations concurrently with Edge-TTS"""
+        import edge_tts
+        
+        voice = voice or self.VOICES[0]
+        
+        async def save(text, path):
+            await edge_tts.Communicate(text, voice).save(path)
+        
+        async def generate_all():
+            return await asyncio.gather(
+                *(save(text, path) for text, path in zip(texts, paths)),
+                return_exceptions=True
+            )
+        
+        results = self._run(generate_all())
+        
+        ok = []
+        for path, result in zip(paths, results):
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Edge-TTS failed for {path}: {result}")
+            ok.append(not isinstance(result, Exception) and os.path.exists(path) and os.path.getsize(path) > 1000)
+        return ok
+    
+    @staticmethod
+    def _probe(path: str) -> dict:
+        """First video stream's codec, size, format and timing via ffprobe ({} if unreadable)"""
+        import subprocess
+        try:
+            out = subprocess.run(
+                ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+                 '-show_entries', 'stream=width,height,codec_name,pix_fmt,sample_aspect_ratio,'
+                                  'r_frame_rate,time_base,profile,level',
+                 '-of', 'json', path],
+                capture_output=True, text=True, timeout=30
+            ).stdout
+            return (json.loads(out or '{}').get('streams') or [{}])[0]
+        except (OSError, subprocess.SubprocessError, ValueError):
+            return {}
+    
+    def _matches_background(self, info: dict) -> bool:
+        """True if a clip can go into the background as-is (no re-encode needed)"""
+        return (
+            info.get('codec_name') == 'h264'
+            and info.get('pix_fmt') == 'yuv420p'
+            and info.get('width') == self.BG_WIDTH
+            and info.get('height') == self.BG_HEIGHT
+            and info.get('sample_aspect_ratio', '1:1') in ('1:1', '0:1', 'N/A')
+        )
+    
     def create_background_with_ffmpeg(self, clips_paths: List[str], total_duration: float) -> str:
         """Create background using FFmpeg (memory efficient)"""
         try:
             import subprocess
             
-            processed_clips = []
-            target_duration = total_duration / len(clips_paths)
+            probes = [self._probe(path) for path in clips_paths]
+            # A clip ffprobe can't read would fail the whole single-process build
+            usable = [(path, info) for path, info in zip(clips_paths, probes) if info]
+            if not usable:
+                return None
+            
+            target_duration = total_duration / len(usable)
+            durations = [target_duration] * len(usable)
+            durations[-1] += 1.0
             
-            for i, clip_path in enumerate(clips_paths):
-                output_path = clip_path.replace(".mp4", f"_proc_{i}.mp4")
+            final_bg = "temp/final_background.mp4"
+            
+            # The concat demuxer needs identical streams: same format, and the
+            # same frame rate, time base and H.264 profile/level across clips
+            stream_params = {
+                (info.get('r_frame_rate'), info.get('time_base'), info.get('profile'), info.get('level'))
+                for _, info in usable
+            }
+            
+            if all(self._matches_background(info) for _, info in usable) and len(stream_params) == 1:
+                # Every clip is already 720x1280 H.264 yuv420p with matching timing:
+                # trim and join them losslessly, no decode or encode at all
+                logger.info("⚡ All clips match the background format, stream-copying")
+                concat_list = "temp/concat_list.txt"
+                with open(concat_list, 'w') as f:
+                    for (path, _), duration in zip(usable, durations):
+                        abs_path = os.path.abspath(path).replace('\\', '/')
+                        f.write(f"file '{abs_path}'\noutpoint {duration:.3f}\n")
                 
-                duration = target_duration + 1.0 if i == len(clips_paths) - 1 else target_duration
+                cmd = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', concat_list,
+                       '-c', 'copy', '-an', '-avoid_negative_ts', 'make_zero', final_bg]
+            else:
+                # One ffmpeg process normalizes, trims and concatenates every clip
+                # in a single filter graph - no per-clip processes or intermediates
+                inputs, chains = [], []
+                for i, ((path, _), duration) in enumerate(zip(usable, durations)):
+                    inputs += ['-t', f"{duration:.3f}", '-i', path]
+                    chains.append(f"[{i}:v]{self.NORMALIZE_VF},setpts=PTS-STARTPTS[v{i}]")
                 
-                cmd = [
-                    'ffmpeg', '-y', '-i', clip_path,
-                    '-vf', f'scale=720:1280:force_original_aspect_ratio=decrease,pad=720:1280:(ow-iw)/2:(oh-ih)/2:black,setsar=1',
-                    '-t', str(duration),
-                    '-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '28', '-an',
-                    output_path
-                ]
+                labels = ''.join(f"[v{i}]" for i in range(len(usable)))
+                graph = ';'.join(chains) + f";{labels}concat=n={len(usable)}:v=1:a=0[out]"
                 
-                result = subprocess.run(cmd, capture_output=True, check=False)
+                if self.nvenc_available():
+                    encode_args = ['-c:v', 'h264_nvenc', '-preset', 'p1', '-rc', 'vbr', '-cq', '28']
+                else:
+                    encode_args = ['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '28']
                 
-                if os.path.exists(output_path):
-                    processed_clips.append(output_path)
-            
-            if not processed_clips:
-                return None
+                cmd = ['ffmpeg', '-y', *inputs, '-filter_complex', graph, '-map', '[out]',
+                       *encode_args, '-an', final_bg]
             
-            concat_list = "temp/concat_list.txt"
-            with open(concat_list, 'w') as f:
-                for path in processed_clips:
-                    abs_path = os.path.abspath(path).replace('\\', '/')
-                    f.write(f"file '{abs_path}'\n")
-            
-            final_bg = "temp/final_background.mp4"
-            concat_cmd = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', concat_list, '-c', 'copy', final_bg]
-            subprocess.run(concat_cmd, check=True, capture_output=True)
+            subprocess.run(cmd, check=True, capture_output=True)
             
             if os.path.exists(final_bg):
                 logger.info(f"✅ Background created: {final_bg}")
@@ -440,12 +652,11 @@ class VideoComposerFixed:
                     import edge_tts
                     
                     async def generate_voice():
-                        voices = ["en-US-ChristopherNeural", "en-US-GuyNeural", "en-US-AriaNeural"]
-                        voice = voices[attempt % len(voices)]
+                        voice = self.VOICES[attempt % len(self.VOICES)]
                         communicate = edge_tts.Communicate(narration, voice)
                         await communicate.save(voice_path)
                     
-                    asyncio.run(generate_voice())
+                    self._run(generate_voice())
                     
                     if os.path.exists(voice_path) and os.path.getsize(voice_path) > 1000:
                         logger.info("✅ Edge-TTS success")
@@ -573,16 +784,23 @@ class VideoComposerFixed:
             final_video = CompositeVideoClip(clips, size=(720, 1280))
             final_video = final_video.with_audio(audio)
             
+            if self.nvenc_available():
+                # Encoding runs on the NVENC ASIC; its preset overrides MoviePy's
+                # Constant-quality VBR, so no target bitrate (it would override -cq)
+                encode_args = {
+                    'codec': 'h264_nvenc',
+                    'ffmpeg_params': ['-preset', 'p1', '-rc', 'vbr', '-cq', '23']
+                }
+            else:
+                encode_args = {'codec': 'libx264', 'preset': 'ultrafast', 'threads': 1, 'bitrate': '3000k'}
+            
             logger.info(f"💾 Writing video to {output_path}...")
             final_video.write_videofile(
                 output_path,
                 fps=30,
-                codec='libx264',
                 audio_codec='aac',
-                bitrate='3000k',
-                preset='ultrafast',
-                threads=1,
-                logger=None
+                logger=None,
+                **encode_args
             )
             
             logger.info(f"✅ Video created: {output_path} ({actual_duration:.2f}s)")
@@ -610,7 +828,13 @@ class VideoComposerFixed:
 class MasterOrchestrator:
     """Production-ready automation orchestrator"""
     
+    # Signature of the last analysis that was published, so an unchanged
+    # analysis (same trending video, cached LLM answer) isn't rendered again
+    CONTENT_SIG_FILE = Path("faceless_empire/content_sig.json")
+    
     def __init__(self):
+        _load_optional_modules()
+        
         Path("faceless_empire/videos").mkdir(parents=True, exist_ok=True)
         Path("temp").mkdir(exist_ok=True)
         
@@ -636,12 +860,45 @@ class MasterOrchestrator:
         
         logger.info("✅ Master Orchestrator initialized")
     
+    def close(self):
+        """Release pooled HTTP connections (the orchestrator is reused across runs)"""
+        self.video_composer.broll_fetcher.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    @staticmethod
+    def _content_signature(analysis: dict) -> str:
+        """Stable hash of an analysis dict"""
+        return hashlib.blake2b(
+            json.dumps(analysis, sort_keys=True).encode('utf-8'), digest_size=16
+        ).hexdigest()
+    
+    def _load_content_sig(self) -> dict:
+        """Last published signature record, or {} if none"""
+        try:
+            with open(self.CONTENT_SIG_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_content_sig(self, sig: str, youtube_url: str, run_time: datetime):
+        """Record the published analysis signature (write-then-rename)"""
+        tmp_file = f"{self.CONTENT_SIG_FILE}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({'sig': sig, 'youtube_url': youtube_url, 'timestamp': run_time.isoformat()}, f)
+        os.replace(tmp_file, self.CONTENT_SIG_FILE)
+    
     def run_daily_automation(self):
         """Run complete automation cycle"""
+        # One clock read per run, so the log line, file name and result agree
+        run_time = datetime.now()
+        
         try:
-            logger.info("\n" + "="*80)
-            logger.info(f"🚀 DAILY AUTOMATION STARTED - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            logger.info("="*80 + "\n")
+            logger.info(f"\n{BANNER}\n🚀 DAILY AUTOMATION STARTED - {run_time.strftime('%Y-%m-%d %H:%M:%S')}\n{BANNER}\n")
             
             # PHASE 1: Content Analysis
             logger.info("📍 PHASE 1: Content analysis...")
@@ -681,6 +938,19 @@ class MasterOrchestrator:
             
             logger.info("✅ Analysis complete")
             
+            # Identical analysis to the last published video - skip PHASE 2-3
+            content_sig = self._content_signature(analysis)
+            previous = self._load_content_sig()
+            if previous.get('sig') == content_sig:
+                logger.info(f"♻️ Duplicate analysis, skipping encode (already published: {previous.get('youtube_url')})")
+                return {
+                    'status': 'skipped',
+                    'reason': 'duplicate_content',
+                    'analysis': analysis,
+                    'youtube_url': previous.get('youtube_url'),
+                    'timestamp': run_time.isoformat()
+                }
+            
             # PHASE 2: Generate video
             logger.info("\n📍 PHASE 2: Generating video...")
             
@@ -691,7 +961,7 @@ class MasterOrchestrator:
                 'topic': analysis.get('key_topics', 'technology').split(',')[0].strip()
             }
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = run_time.strftime("%Y%m%d_%H%M%S")
             output_path = f"faceless_empire/videos/video_{timestamp}.mp4"
             
             self.video_composer.generate_voice_and_video(script, output_path)
@@ -741,15 +1011,18 @@ class MasterOrchestrator:
                 except:
                     pass
             
-            logger.info("\n" + "="*80)
-            logger.info("🎉 DAILY AUTOMATION COMPLETE!")
-            logger.info("="*80 + "\n")
+            if youtube_url:
+                self._save_content_sig(content_sig, youtube_url, run_time)
+            
+            logger.info(f"🧠 Analysis cache: {_analysis_cache.stats()}")
+            
+            logger.info(f"\n{BANNER}\n🎉 DAILY AUTOMATION COMPLETE!\n{BANNER}\n")
             
             return {
                 'status': 'success',
                 'analysis': analysis,
                 'youtube_url': youtube_url,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': run_time.isoformat()
             }
         
         except Exception as e:
@@ -762,8 +1035,8 @@ class MasterOrchestrator:
 def main():
     """Entry point"""
     try:
-        orchestrator = MasterOrchestrator()
-        orchestrator.run_daily_automation()
+        with MasterOrchestrator() as orchestrator:
+            orchestrator.run_daily_automation()
     except Exception as e:
         logger.error(f"❌ Fatal error: {e}")
         sys.exit(1)
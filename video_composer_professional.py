@@ -56,10 +56,11 @@ class BRollFetcher:
                         
                         # Download
                         output_path = os.path.join(output_dir, f"broll_pexels_{i}.mp4")
-                        video_data = requests.get(video_url, timeout=30)
-                        
-                        with open(output_path, 'wb') as f:
-                            f.write(video_data.content)
+                        with requests.get(video_url, timeout=30, stream=True) as video_data:
+                            video_data.raise_for_status()
+                            with open(output_path, 'wb') as f:
+                                for chunk in video_data.iter_content(1 << 16):
+                                    f.write(chunk)
                         
                         clips_paths.append(output_path)
                         logger.info(f"✅ Pexels clip downloaded: {output_path}")
@@ -91,10 +92,11 @@ class BRollFetcher:
                             
                             if video_url:
                                 output_path = os.path.join(output_dir, f"broll_pixabay_{i}.mp4")
-                                video_data = requests.get(video_url, timeout=30)
-                                
-                                with open(output_path, 'wb') as f:
-                                    f.write(video_data.content)
+                                with requests.get(video_url, timeout=30, stream=True) as video_data:
+                                    video_data.raise_for_status()
+                                    with open(output_path, 'wb') as f:
+                                        for chunk in video_data.iter_content(1 << 16):
+                                            f.write(chunk)
                                 
                                 clips_paths.append(output_path)
                                 logger.info(f"✅ Pixabay clip downloaded: {output_path}")
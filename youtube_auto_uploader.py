@@ -9,6 +9,7 @@ import pickle
 import logging
 import json
 import base64
+import threading
 from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
@@ -22,6 +23,10 @@ from googleapiclient.errors import HttpError
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Process-wide cap on concurrent uploads: every caller (daily run, autopilot,
+# batch backfill) goes through upload_video, so they all share this
+UPLOAD_SEM = threading.BoundedSemaphore(int(os.getenv("MAX_CONCURRENT_UPLOADS", 4)))
+
 class YouTubeUploader:
     """Complete YouTube upload automation with OAuth"""
     
@@ -29,6 +34,12 @@ class YouTubeUploader:
     CLIENT_SECRET_FILE = 'client_secret.json'
     TOKEN_FILE = 'token.pickle'
     
+    # Resumable-upload chunk (multiple of 256 KiB): a Short goes up in a few
+    # requests instead of one round-trip per MiB
+    UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+    # Retries per chunk on 429/5xx and connection errors (backoff is the client library's)
+    MAX_RETRIES = 5
+    
     def __init__(self):
         self.youtube = None
         self.authenticate()
@@ -170,7 +181,7 @@ class YouTubeUploader:
         # Upload file
         media = MediaFileUpload(
             video_path,
-            chunksize=1024*1024,
+            chunksize=self.UPLOAD_CHUNK_SIZE,
             resumable=True,
             mimetype='video/mp4'
         )
@@ -182,17 +193,21 @@ class YouTubeUploader:
                 media_body=media
             )
             
-            response = None
-            last_progress = 0
-            
-            while response is None:
-                status, response = request.next_chunk()
+            with UPLOAD_SEM:
+                response = None
+                last_progress = 0
                 
-                if status:
-                    progress = int(status.progress() * 100)
-                    if progress > last_progress + 10:
-                        logger.info(f"   Upload progress: {progress}%")
-                        last_progress = progress
+                while response is None:
+                    # num_retries: the client library backs off exponentially on
+                    # 429/5xx and socket errors, resuming the same session from
+                    # the last acknowledged byte
+                    status, response = request.next_chunk(num_retries=self.MAX_RETRIES)
+                    
+                    if status:
+                        progress = int(status.progress() * 100)
+                        if progress > last_progress + 10:
+                            logger.info(f"   Upload progress: {progress}%")
+                            last_progress = progress
             
             video_id = response['id']
             